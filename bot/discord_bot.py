@@ -3,15 +3,25 @@
 import discord
 from discord.ext import commands
 import asyncio
+import hashlib
 import logging
 
 from bot.commands import setup_commands
 from bot.utils import build_embed, get_color_and_emoji
 
+logger = logging.getLogger(__name__)
+
 class DiscordBot:
     """
     Encapsulates the Discord bot setup, event handling, and message management.
     """
+    # Seconds to wait for further updates to the same key before sending
+    COALESCE_DELAY = 0.25
+    # Delivery attempts per update when Discord returns a server error
+    MAX_DELIVERY_ATTEMPTS = 3
+    # Seconds to wait before the first retry, doubled after each failed attempt
+    RETRY_BASE_DELAY = 2.0
+
     def __init__(self, config, data_persistence):
         """
         Initializes the DiscordBot instance.
@@ -23,26 +33,171 @@ class DiscordBot:
         self.config = config
         self.data_persistence = data_persistence
         self.bot = commands.Bot(command_prefix="!", intents=discord.Intents.default())
+        self._channel_cache = {}
+        self._pending_keys = {}
+        self._channel_queues = {}
+        self._channel_workers = {}
+        self._startup_callbacks = []
+        self._data_store = data_persistence.get_data_store()
+        data_persistence.add_change_listener(self._on_data_store_replaced)
         self.setup_event_handlers()
-        setup_commands(self.bot, self.config, self.data_persistence)
 
     def setup_event_handlers(self):
         """
         Sets up Discord bot event handlers, such as on_ready.
         """
+        @self.bot.event
+        async def setup_hook():
+            """
+            Called once before the bot connects to Discord.
+            Runs the startup callbacks, registers the handler administration commands and
+            syncs the command tree if the commands changed since the last sync.
+            """
+            # The event loop is running from here on, so cross-thread wakeups can be scheduled.
+            # Run the callbacks first, so a slow command tree sync does not hold up webhooks.
+            for callback in self._startup_callbacks:
+                callback()
+            await setup_commands(self.bot, self.config, self.data_persistence)
+            await self.sync_command_tree()
+
         @self.bot.event
         async def on_ready():
             """
             Event handler for when the bot becomes ready.
-            Syncs the command tree to ensure all hybrid commands are registered.
             """
+            logger.info("Logged in as %s (ID: %s)", self.bot.user, self.bot.user.id)
+            logger.info("Discord bot is ready.")
+
+        @self.bot.event
+        async def on_guild_channel_delete(channel):
+            """
+            Event handler for when a guild channel is deleted.
+            Evicts the channel from the channel cache.
+            """
+            self._channel_cache.pop(channel.id, None)
+
+        @self.bot.event
+        async def on_guild_channel_update(before, after):
+            """
+            Event handler for when a guild channel is updated.
+            Evicts the stale channel object from the channel cache.
+            """
+            self._channel_cache.pop(before.id, None)
+
+    def add_startup_callback(self, callback):
+        """
+        Registers a callback to run on the bot's event loop once it has started,
+        before the bot connects to Discord.
+
+        Parameters:
+        - callback (callable): Called without arguments.
+        """
+        self._startup_callbacks.append(callback)
+
+    def _command_tree_version(self):
+        """
+        Computes a fingerprint of the application commands registered on the command tree.
+
+        Returns:
+        - str: A hex digest that changes whenever a command, its description or parameters change.
+        """
+        signature = sorted(
+            (
+                command.qualified_name,
+                command.description,
+                tuple((param.name, str(param.type), param.required) for param in getattr(command, "parameters", ())),
+            )
+            for command in self.bot.tree.walk_commands()
+        )
+        payload = repr((self.bot.application_id, signature)).encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    async def sync_command_tree(self):
+        """
+        Publishes the command tree to Discord, skipping the sync when the commands
+        are unchanged since the last successful sync.
+        """
+        version = self._command_tree_version()
+        if self._data_store.get("tree_version") == version:
+            logger.info("Command tree unchanged, skipping sync.")
+            return
+        try:
             await self.bot.tree.sync()
-            logging.info(f"Logged in as {self.bot.user} (ID: {self.bot.user.id})")
-            logging.info("Discord bot is ready.")
+        except discord.HTTPException as e:
+            # Keep the bot running with the previously synced commands; retried on next start
+            logger.error("Failed to sync command tree: %s", e)
+            return
+        await asyncio.get_running_loop().run_in_executor(None, self.data_persistence.update_data_store, "tree_version", version)
+        logger.info("Command tree synced.")
+
+    def _on_data_store_replaced(self, data_store):
+        """
+        Refreshes the cached DATA_STORE reference after data persistence reloads it.
+
+        Parameters:
+        - data_store (Mapping): A read-only view of the new DATA_STORE.
+        """
+        self._data_store = data_store
+
+    def get_channel(self, channel_id):
+        """
+        Resolves a Discord channel by ID, caching the result for subsequent lookups.
+
+        Parameters:
+        - channel_id (int): The Discord channel ID.
+
+        Returns:
+        - discord.abc.Messageable or None: The channel, or None if it cannot be found.
+        """
+        channel = self._channel_cache.get(channel_id)
+        if channel is None:
+            channel = self.bot.get_channel(channel_id)
+            if channel is not None:
+                self._channel_cache[channel_id] = channel
+        return channel
+
+    def _get_enabled_handler_config(self, handler):
+        """
+        Looks up the configuration of an event handler if it is enabled.
+
+        Parameters:
+        - handler (str): The name of the event handler.
+
+        Returns:
+        - dict or None: The handler configuration, or None if the handler is missing or disabled.
+        """
+        handler_config = self._data_store.get("handlers", {}).get(handler)
+        if not handler_config or not handler_config.get("enabled", False):
+            return None
+        return handler_config
 
     async def send_or_edit(self, key, handler_name=None):
         """
-        Sends a new Discord message or edits an existing one based on the unique key.
+        Schedules a Discord message send or edit for the unique key.
+        Updates to the same key arriving within COALESCE_DELAY seconds are coalesced,
+        so only the latest state is sent.
+
+        Parameters:
+        - key (str): The unique key for the "thing" (e.g., "push:abcd1234").
+        - handler_name (str, optional): The name of the event handler that processed this event.
+        """
+        # Drop events for disabled handlers before any coalescing or lookups
+        handler, _, _ = key.partition(':')
+        if self._get_enabled_handler_config(handler) is None:
+            logger.debug("Handler '%s' is disabled. Skipping send_or_edit for key '%s'.", handler, key)
+            return
+
+        already_pending = key in self._pending_keys
+        self._pending_keys[key] = handler_name
+        if already_pending:
+            return
+        await asyncio.sleep(self.COALESCE_DELAY)
+        handler_name = self._pending_keys.pop(key)
+        await self._do_send_or_edit(key, handler_name=handler_name)
+
+    async def _do_send_or_edit(self, key, handler_name=None):
+        """
+        Queues a Discord message send or edit for the unique key on its channel's queue.
         Respects the current settings for event handlers and selected channel.
 
         Parameters:
@@ -50,49 +205,119 @@ class DiscordBot:
         - handler_name (str, optional): The name of the event handler that processed this event.
         """
         # Extract handler name from key
-        handler = key.split(':')[0]
+        handler, _, _ = key.partition(':')
 
-        # Check if handler is enabled
-        handlers = self.data_persistence.get_data_store().get("handlers", {})
-        handler_config = handlers.get(handler, {})
-        if not handler_config.get("enabled", False):
-            logging.info(f"Handler '{handler}' is disabled. Skipping send_or_edit for key '{key}'.")
+        # Re-check the handler, it may have been disabled while the update was pending
+        handler_config = self._get_enabled_handler_config(handler)
+        if handler_config is None:
+            logger.debug("Handler '%s' is disabled. Skipping send_or_edit for key '%s'.", handler, key)
             return
 
-        # Retrieve data from DATA_STORE
-        data = self.data_persistence.get_data_store().get(key, {})
-        embed = build_embed(key, data, handler_name=handler_name)
-
         # Get the channel ID from handler configuration
         channel_id = handler_config.get("channel_id", self.config.DEFAULT_DISCORD_CHANNEL_ID)
-        channel = self.bot.get_channel(channel_id)
+        if not self.get_channel(channel_id):
+            logger.error("Channel %s for handler '%s' not found.", channel_id, handler)
+            return
+
+        self._get_channel_queue(channel_id).put_nowait((key, handler_name))
+
+    def _get_channel_queue(self, channel_id):
+        """
+        Returns the delivery queue for a channel, starting its drain task on first use.
+
+        Parameters:
+        - channel_id (int): The Discord channel ID.
+
+        Returns:
+        - asyncio.Queue: The queue of (key, handler_name) pairs awaiting delivery.
+        """
+        queue = self._channel_queues.get(channel_id)
+        if queue is None:
+            queue = self._channel_queues[channel_id] = asyncio.Queue()
+            self._channel_workers[channel_id] = asyncio.create_task(self._drain_channel_queue(channel_id, queue))
+        return queue
+
+    async def _drain_channel_queue(self, channel_id, queue):
+        """
+        Delivers queued updates for a single channel in order. A rate-limited or failing
+        channel only delays its own queue, not the deliveries for other channels.
+
+        Parameters:
+        - channel_id (int): The Discord channel ID.
+        - queue (asyncio.Queue): The channel's delivery queue.
+        """
+        while True:
+            key, handler_name = await queue.get()
+            try:
+                await self._deliver(channel_id, key, handler_name=handler_name)
+            except Exception as e:
+                logger.error("Unexpected error for %s: %s", key, e)
+            finally:
+                queue.task_done()
+
+    async def _deliver(self, channel_id, key, handler_name=None):
+        """
+        Builds the embed for the unique key and sends or edits its message, retrying with
+        exponential backoff when Discord returns a server error.
+        Rate limits (HTTP 429) are waited out by discord.py's HTTP client itself.
+
+        Parameters:
+        - channel_id (int): The Discord channel ID.
+        - key (str): The unique key for the "thing" (e.g., "push:abcd1234").
+        - handler_name (str, optional): The name of the event handler that processed this event.
+        """
+        channel = self.get_channel(channel_id)
         if not channel:
-            logging.error(f"Channel {channel_id} for handler '{handler}' not found.")
+            logger.error("Channel %s for key '%s' not found.", channel_id, key)
             return
 
-        try:
-            message_map = self.data_persistence.get_message_map()
-            if key in message_map:
-                # Edit existing message
-                message_id = message_map[key]
-                try:
-                    old_msg = await channel.fetch_message(message_id)
-                    await old_msg.edit(embed=embed)
-                    logging.info(f"Edited existing message for {key} in channel '{channel.name}'")
-                except discord.NotFound:
-                    # If message not found, send a new one
-                    new_msg = await channel.send(embed=embed)
-                    self.data_persistence.update_message_map(key, new_msg.id)
-                    logging.info(f"Sent new message (old not found) for {key} in channel '{channel.name}'")
-            else:
-                # Send new message
+        # Retrieve data from DATA_STORE
+        data = self._data_store.get(key, {})
+        now = discord.utils.utcnow()
+        embed = build_embed(key, data, handler_name=handler_name, now=now)
+
+        for attempt in range(1, self.MAX_DELIVERY_ATTEMPTS + 1):
+            try:
+                await self._send_or_edit_message(channel, key, embed)
+                return
+            except discord.DiscordServerError as e:
+                if attempt == self.MAX_DELIVERY_ATTEMPTS:
+                    logger.error("Giving up on %s after %d attempts: %s", key, attempt, e)
+                    return
+                delay = self.RETRY_BASE_DELAY * 2 ** (attempt - 1)
+                logger.warning("Discord server error for %s, retrying in %.1fs: %s", key, delay, e)
+                await asyncio.sleep(delay)
+            except discord.HTTPException as e:
+                logger.error("Discord HTTPException for %s: %s", key, e)
+                return
+
+    async def _send_or_edit_message(self, channel, key, embed):
+        """
+        Sends a new Discord message or edits the existing one mapped to the unique key.
+
+        Parameters:
+        - channel (discord.abc.Messageable): The channel to post in.
+        - key (str): The unique key for the "thing" (e.g., "push:abcd1234").
+        - embed (discord.Embed): The embed to send.
+        """
+        message_map = self.data_persistence.get_message_map()
+        if key in message_map:
+            # Edit existing message
+            message_id = message_map[key]
+            try:
+                # Edit through a partial message to skip the fetch round-trip
+                await channel.get_partial_message(message_id).edit(embed=embed)
+                logger.info("Edited existing message for %s in channel '%s'", key, channel.name)
+            except discord.NotFound:
+                # If message not found, send a new one
                 new_msg = await channel.send(embed=embed)
                 self.data_persistence.update_message_map(key, new_msg.id)
-                logging.info(f"Sent new message for {key} in channel '{channel.name}'")
-        except discord.HTTPException as e:
-            logging.error(f"Discord HTTPException for {key}: {e}")
-        except Exception as e:
-            logging.error(f"Unexpected error for {key}: {e}")
+                logger.info("Sent new message (old not found) for %s in channel '%s'", key, channel.name)
+        else:
+            # Send new message
+            new_msg = await channel.send(embed=embed)
+            self.data_persistence.update_message_map(key, new_msg.id)
+            logger.info("Sent new message for %s in channel '%s'", key, channel.name)
 
     def run(self):
         """
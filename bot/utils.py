@@ -5,6 +5,45 @@ import json
 import logging
 from discord import Embed, Color
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Author shown on every embed, passed straight to Embed.set_author
+_AUTHOR = {
+    "name": "GitHub Watcher",
+    "icon_url": "https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png",
+}
+
+# Shared Color instances, so building an embed does not allocate new ones
+_C_GREEN = Color.green()
+_C_RED = Color.red()
+_C_BLUE = Color.blue()
+_C_DARK_BLUE = Color.dark_blue()
+_C_GOLD = Color.gold()
+_C_PURPLE = Color.purple()
+_C_GREYPLE = Color.greyple()
+_C_ORANGE = Color.orange()
+_C_BLURPLE = Color.blurple()
+
+# Maps a lowercase event status to its (color, emoji) pair
+_STATUS_STYLES = dict.fromkeys(
+    ("completed", "success", "passed", "merged", "active", "commented", "approved"),
+    (_C_GREEN, "✅"),
+)
+_STATUS_STYLES.update(dict.fromkeys(
+    ("in_progress", "queued", "waiting", "running", "started"),
+    (_C_ORANGE, "⏳"),
+))
+_STATUS_STYLES.update(dict.fromkeys(
+    ("failure", "failed", "error", "cancelled", "declined", "changes_requested"),
+    (_C_RED, "❌"),
+))
+_DEFAULT_STATUS_STYLE = (_C_BLURPLE, "ℹ️")
+
 def get_color_and_emoji(status):
     """
     Determines the color and emoji based on the status of the event.
@@ -15,17 +54,429 @@ def get_color_and_emoji(status):
     Returns:
     - tuple: (discord.Color, str) corresponding color and emoji.
     """
-    status = status.lower()
-    if status in ["completed", "success", "passed", "merged", "active", "commented", "approved"]:
-        return Color.green(), "✅"
-    elif status in ["in_progress", "queued", "waiting", "running", "started"]:
-        return Color.orange(), "⏳"
-    elif status in ["failure", "failed", "error", "cancelled", "declined", "changes_requested"]:
-        return Color.red(), "❌"
+    return _STATUS_STYLES.get(status.lower(), _DEFAULT_STATUS_STYLE)
+
+def _finalize(embed, handler_name=None, now=None):
+    """
+    Applies the author, timestamp and footer shared by every embed.
+
+    Parameters:
+    - embed (discord.Embed): The embed to finalize.
+    - handler_name (str, optional): The name of the event handler that processed this event.
+    - now (datetime.datetime, optional): The embed timestamp. Defaults to the current UTC time.
+    """
+    embed.set_author(**_AUTHOR)
+    if handler_name:
+        embed.set_footer(text=f"Handled by: {handler_name}")
+    embed.timestamp = now or discord.utils.utcnow()
+
+# Discord rejects embeds whose description is longer than this
+_MAX_DESCRIPTION_LENGTH = 4096
+
+def _build_push(embed, data):
+    """
+    Populates the embed for a push event.
+
+    Parameters:
+    - embed (discord.Embed): The embed to populate.
+    - data (dict): The data associated with the event.
+    """
+    message = data.get("message", "(no message)")
+    url = data.get("url", "#")
+    repo_full_name = data.get("repo_full_name", "unknown/unknown")
+    commits = data.get("commits", [])
+    emoji = "🔀"
+    color, emoji = get_color_and_emoji("success")
+    embed.color = color
+    embed.title = f"{emoji} Push to {repo_full_name}"
+    if len(commits) > 1:
+        # List every commit of the push in a single embed
+        compare_url = data.get("compare_url", url)
+        embed.url = compare_url
+        header = f"**Commits:** {len(commits)}\n"
+        footer = f"\n[View Changes]({compare_url})"
+        # Leave room for the "…and N more" line so the description stays within Discord's limit
+        budget = _MAX_DESCRIPTION_LENGTH - len(header) - len(footer) - len(f"\n…and {len(commits)} more")
+        lines = []
+        for commit in commits:
+            summary = commit.get("message", "").partition("\n")[0][:80]
+            line = f"[`{commit.get('id', '')[:7]}`]({commit.get('url', '#')}) {summary}"
+            budget -= len(line) + 1
+            if budget < 0:
+                break
+            lines.append(line)
+        remaining = len(commits) - len(lines)
+        if remaining:
+            lines.append(f"…and {remaining} more")
+        embed.description = header + "\n".join(lines) + footer
     else:
-        return Color.blurple(), "ℹ️"
+        embed.url = url
+        embed.description = f"**Commit Message:** {message}\n[View Commit]({url})"
+
+def _build_pull_request(embed, data):
+    """
+    Populates the embed for a pull request event.
+
+    Parameters:
+    - embed (discord.Embed): The embed to populate.
+    - data (dict): The data associated with the event.
+    """
+    title = data.get("title", "(no title)")
+    url = data.get("url", "#")
+    action = data.get("action", "unknown")
+    merged = data.get("merged", False)
+    repo_full_name = data.get("repo_full_name", "unknown/unknown")
+    emoji = "🔀" if merged else "📄"
+    color, emoji = get_color_and_emoji("merged" if merged else action)
+    embed.color = color
+    embed.title = f"{emoji} Pull Request: {title}"
+    embed.url = url
+    embed.description = f"**Action:** {action.capitalize()}\n**Repository:** {repo_full_name}\n[View PR]({url})"
+
+def _build_issue_comment(embed, data):
+    """
+    Populates the embed for an issue comment event.
+
+    Parameters:
+    - embed (discord.Embed): The embed to populate.
+    - data (dict): The data associated with the event.
+    """
+    commenter = data.get("user", "unknown")
+    comment_body = data.get("body", "")
+    comment_url = data.get("url", "#")
+    emoji = "💬"
+    color = _C_BLUE
+    embed.color = color
+    embed.title = f"{emoji} Issue Comment by {commenter}"
+    embed.url = comment_url
+    embed.description = f"**Comment:** {comment_body}\n[View Comment]({comment_url})"
+
+def _build_commit_comment(embed, data):
+    """
+    Populates the embed for a commit comment event.
+
+    Parameters:
+    - embed (discord.Embed): The embed to populate.
+    - data (dict): The data associated with the event.
+    """
+    commit_sha = data.get("commit_sha", "unknown")
+    commenter = data.get("commenter", "unknown")
+    comment_url = data.get("url", "#")
+    body = data.get("body", "")
+    repo_full_name = data.get("repo_full_name", "unknown/unknown")
+    emoji = "💬"
+    color, emoji = get_color_and_emoji("commented")
+    embed.color = color
+    embed.title = f"{emoji} Commit Comment by {commenter}"
+    embed.url = comment_url
+    embed.description = (
+        f"**Commit SHA:** [{commit_sha[:7]}](https://github.com/{repo_full_name}/commit/{commit_sha})\n"
+        f"**Commenter:** {commenter}\n"
+        f"**Comment:** {body[:80]}...\n[View Comment]({comment_url})"
+    )
+
+def _build_check_run(embed, data):
+    """
+    Populates the embed for a check run event.
+
+    Parameters:
+    - embed (discord.Embed): The embed to populate.
+    - data (dict): The data associated with the event.
+    """
+    name = data.get("name", "Unnamed Check")
+    url = data.get("url", "#")
+    status = data.get("status", "unknown")
+    conclusion = data.get("conclusion", "unknown")
+    overall_status = conclusion if status == "completed" else status
+    color, emoji = get_color_and_emoji(overall_status)
+    embed.color = color
+    embed.title = f"{emoji} Check Run: {name}"
+    embed.url = url
+    embed.description = f"**Status:** {overall_status.capitalize()}\n[View Check Run]({url})"
+
+def _build_check_suite(embed, data):
+    """
+    Populates the embed for a check suite event.
+
+    Parameters:
+    - embed (discord.Embed): The embed to populate.
+    - data (dict): The data associated with the event.
+    """
+    name = data.get("name", "Unnamed Check Suite")
+    url = data.get("url", "#")
+    status = data.get("status", "unknown")
+    conclusion = data.get("conclusion", "unknown")
+    overall_status = conclusion if status == "completed" else status
+    color, emoji = get_color_and_emoji(overall_status)
+    embed.color = color
+    embed.title = f"{emoji} Check Suite: {name}"
+    embed.url = url
+    embed.description = f"**Status:** {overall_status.capitalize()}\n[View Check Suite]({url})"
+
+def _build_workflow_run(embed, data):
+    """
+    Populates the embed for a workflow run event.
+
+    Parameters:
+    - embed (discord.Embed): The embed to populate.
+    - data (dict): The data associated with the event.
+    """
+    name = data.get("name", "Unnamed Workflow")
+    url = data.get("url", "#")
+    status = data.get("status", "unknown")
+    conclusion = data.get("conclusion", "unknown")
+    overall_status = conclusion if status == "completed" else status
+    color, emoji = get_color_and_emoji(overall_status)
+    embed.color = color
+    embed.title = f"{emoji} Workflow Run: {name}"
+    embed.url = url
+    embed.description = f"**Status:** {overall_status.capitalize()}\n[View Workflow Run]({url})"
+
+def _build_workflow_job(embed, data):
+    """
+    Populates the embed for a workflow job event.
+
+    Parameters:
+    - embed (discord.Embed): The embed to populate.
+    - data (dict): The data associated with the event.
+    """
+    name = data.get("name", "Unnamed Workflow Job")
+    url = data.get("url", "#")
+    status = data.get("status", "unknown")
+    conclusion = data.get("conclusion", "unknown")
+    overall_status = conclusion if status == "completed" else status
+    color, emoji = get_color_and_emoji(overall_status)
+    embed.color = color
+    embed.title = f"{emoji} Workflow Job: {name}"
+    embed.url = url
+    embed.description = f"**Status:** {overall_status.capitalize()}\n[View Workflow Job]({url})"
+
+def _build_create(embed, data):
+    """
+    Populates the embed for a create event (branch or tag creation).
+
+    Parameters:
+    - embed (discord.Embed): The embed to populate.
+    - data (dict): The data associated with the event.
+    """
+    ref_type = data.get("ref_type", "unknown")
+    ref = data.get("ref", "unknown")
+    user = data.get("user", "unknown")
+    ref_url = data.get("ref_url", "#")
 
-def build_embed(key, data, handler_name=None):
+    emoji = "➕" if ref_type == "branch" else "🏷️"
+    color = _C_GREEN if ref_type == "branch" else _C_BLUE
+    ref_type_label = ref_type.capitalize()
+
+    embed.color = color
+    embed.title = f"{emoji} {ref_type_label} Created: {ref}"
+    if ref_url != "#":
+        embed.url = ref_url  # Makes the title a hyperlink to the ref
+
+    desc = f"**Type:** {ref_type_label}\n**Reference:** {ref}\n**Created By:** {user}\n[View {ref_type_label}]({ref_url})"
+    embed.description = desc
+
+def _build_delete(embed, data):
+    """
+    Populates the embed for a delete event (branch or tag deletion).
+
+    Parameters:
+    - embed (discord.Embed): The embed to populate.
+    - data (dict): The data associated with the event.
+    """
+    ref_type = data.get("ref_type", "unknown")
+    ref = data.get("ref", "unknown")
+    user = data.get("user", "unknown")
+    ref_url = data.get("ref_url", "#")
+
+    emoji = "➖" if ref_type == "branch" else "🏷️"
+    color = _C_RED if ref_type == "branch" else _C_DARK_BLUE
+    ref_type_label = ref_type.capitalize()
+
+    embed.color = color
+    embed.title = f"{emoji} {ref_type_label} Deleted: {ref}"
+    if ref_url != "#":
+        embed.url = ref_url  # Makes the title a hyperlink to the ref (if possible)
+
+    desc = f"**Type:** {ref_type_label}\n**Reference:** {ref}\n**Deleted By:** {user}\n[View {ref_type_label}]({ref_url})"
+    embed.description = desc
+
+def _build_fork(embed, data):
+    """
+    Populates the embed for a fork event.
+
+    Parameters:
+    - embed (discord.Embed): The embed to populate.
+    - data (dict): The data associated with the event.
+    """
+    sender = data.get("sender", "unknown")
+    repo_name = data.get("repo_name", "unknown/unknown")
+    forkee_name = data.get("forkee_name", "unknown")
+    forkee_url = data.get("forkee_url", "#")
+
+    emoji = "🍴"
+    color = _C_GOLD
+
+    embed.color = color
+    embed.title = f"{emoji} Repository Forked by {sender}"
+    embed.url = forkee_url
+    embed.description = (
+        f"**Original Repository:** {repo_name}\n"
+        f"**Forked Repository:** [{forkee_name}]({forkee_url})\n"
+        f"[View Fork]({forkee_url})"
+    )
+
+def _build_release(embed, data):
+    """
+    Populates the embed for a release event.
+
+    Parameters:
+    - embed (discord.Embed): The embed to populate.
+    - data (dict): The data associated with the event.
+    """
+    action = data.get("action", "unknown")
+    name = data.get("name", "No Name")
+    url = data.get("url", "#")
+    publisher = data.get("publisher", "unknown")
+
+    emoji = "📦"
+    color = _C_BLUE
+    action_label = action.capitalize()
+
+    embed.color = color
+    embed.title = f"{emoji} Release {action_label}: {name}"
+    embed.url = url
+    embed.description = (
+        f"**Name:** {name}\n"
+        f"**Action:** {action_label}\n"
+        f"**Publisher:** {publisher}\n"
+        f"[View Release]({url})"
+    )
+
+def _build_repository(embed, data):
+    """
+    Populates the embed for a repository event.
+
+    Parameters:
+    - embed (discord.Embed): The embed to populate.
+    - data (dict): The data associated with the event.
+    """
+    action = data.get("action", "unknown")
+    repo_name = data.get("name", "unknown")
+    repo_url = data.get("url", "#")
+    owner = data.get("owner", "unknown")
+
+    emoji = "🏠"
+    color = _C_GREYPLE
+    action_label = action.capitalize()
+
+    embed.color = color
+    embed.title = f"{emoji} Repository {action_label}: {repo_name}"
+    embed.url = repo_url
+    embed.description = (
+        f"**Repository:** [{repo_name}]({repo_url})\n"
+        f"**Action:** {action_label}\n"
+        f"**Owner:** {owner}\n"
+        f"[View Repository]({repo_url})"
+    )
+
+def _build_watch(embed, data):
+    """
+    Populates the embed for a watch/star event.
+
+    Parameters:
+    - embed (discord.Embed): The embed to populate.
+    - data (dict): The data associated with the event.
+    """
+    user = data.get("user", "unknown")
+    repo_name = data.get("repo_name", "unknown")
+    repo_url = data.get("repo_url", "#")
+    action = data.get("action", "starred")
+
+    emoji = "⭐"
+    color = _C_GOLD
+
+    embed.color = color
+    embed.title = f"{emoji} {action.capitalize()} Repository"
+    embed.url = repo_url
+    embed.description = (
+        f"**User:** {user}\n"
+        f"**Repository:** [{repo_name}]({repo_url})\n"
+        f"[View Repository]({repo_url})"
+    )
+
+def _build_member(embed, data):
+    """
+    Populates the embed for a member event.
+
+    Parameters:
+    - embed (discord.Embed): The embed to populate.
+    - data (dict): The data associated with the event.
+    """
+    member_login = data.get("member_login", "unknown")
+    action = data.get("action", "unknown")
+    repo_full_name = data.get("repo_full_name", "unknown/unknown")
+    repo_url = data.get("repo_url", "#")
+
+    emoji = "👥"
+    color = _C_PURPLE
+    action_label = action.capitalize()
+
+    embed.color = color
+    embed.title = f"{emoji} Member {action_label}"
+    embed.url = repo_url
+    embed.description = (
+        f"**Member:** {member_login}\n"
+        f"**Action:** {action_label}\n"
+        f"**Repository:** [{repo_full_name}]({repo_url})\n"
+        f"[View Repository]({repo_url})"
+    )
+
+def _build_other(embed, data):
+    """
+    Populates the embed for an event without a dedicated builder, embedding the raw payload.
+
+    Parameters:
+    - embed (discord.Embed): The embed to populate.
+    - data (dict): The data associated with the event.
+    """
+    embed.title = "⚙️ Other Event"
+    embed.description = "No detailed storage for this event."
+    embed.color = _C_GREYPLE
+
+    try:
+        if orjson is not None:
+            raw_payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            raw_payload = json.dumps(data, indent=2).encode()
+        # Truncate on the encoded bytes so the payload is only transcoded once
+        if len(raw_payload) > 1800:
+            raw_payload = raw_payload[:1800] + b"...\n```json\n[Truncated]"
+        json_payload = raw_payload.decode("utf-8", "replace")
+        embed.add_field(name="Event Payload", value=f"```json\n{json_payload}```", inline=False)
+    except Exception as e:
+        embed.add_field(name="Error", value=f"Failed to serialize event payload: {e}", inline=False)
+
+# Maps the kind prefix of a key to the function that populates its embed
+_BUILDERS = {
+    "push": _build_push,
+    "pull_request": _build_pull_request,
+    "issue_comment": _build_issue_comment,
+    "commit_comment": _build_commit_comment,
+    "check_run": _build_check_run,
+    "check_suite": _build_check_suite,
+    "workflow_run": _build_workflow_run,
+    "workflow_job": _build_workflow_job,
+    "create": _build_create,
+    "delete": _build_delete,
+    "fork": _build_fork,
+    "release": _build_release,
+    "repository": _build_repository,
+    "watch": _build_watch,
+    "member": _build_member,
+}
+
+def build_embed(key, data, handler_name=None, now=None):
     """
     Constructs a Discord embed based on the data associated with the unique key.
 
@@ -33,378 +484,22 @@ def build_embed(key, data, handler_name=None):
     - key (str): The unique key for the "thing" (e.g., "push:abcd1234").
     - data (dict): The data associated with the key.
     - handler_name (str, optional): The name of the event handler that processed this event.
+    - now (datetime.datetime, optional): The embed timestamp. Defaults to the current UTC time.
 
     Returns:
     - discord.Embed: The constructed Discord embed.
     """
-    try:
-        kind, ident = key.split(':', 1)
-    except ValueError:
+    kind, sep, ident = key.partition(':')
+    if not sep:
         kind, ident = "unknown", key
 
-    logging.debug(f"build_embed called with kind='{kind}', ident='{ident}', handler_name='{handler_name}'")
-
-    embed = Embed(color=Color.blurple())  # Default color
+    logger.debug("build_embed called with kind='%s', ident='%s', handler_name='%s'", kind, ident, handler_name)
 
-    if kind == "push":
-        # Building an embed for a push event
-        message = data.get("message", "(no message)")
-        url = data.get("url", "#")
-        repo_full_name = data.get("repo_full_name", "unknown/unknown")
-        emoji = "🔀"
-        color, emoji = get_color_and_emoji("success")
-        embed.color = color
-        embed.title = f"{emoji} Push to {repo_full_name}"
-        embed.url = url
-        embed.description = f"**Commit Message:** {message}\n[View Commit]({url})"
-        if handler_name:
-            embed.set_footer(text=f"Handled by: {handler_name}")
-        embed.set_author(name="GitHub Watcher", icon_url="https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png")
-        embed.timestamp = discord.utils.utcnow()
-        logging.info(f"Built embed for push event: {key}")
-
-    elif kind == "pull_request":
-        # Building an embed for a pull request event
-        title = data.get("title", "(no title)")
-        url = data.get("url", "#")
-        action = data.get("action", "unknown")
-        merged = data.get("merged", False)
-        repo_full_name = data.get("repo_full_name", "unknown/unknown")
-        emoji = "🔀" if merged else "📄"
-        color, emoji = get_color_and_emoji("merged" if merged else action)
-        embed.color = color
-        embed.title = f"{emoji} Pull Request: {title}"
-        embed.url = url
-        embed.description = f"**Action:** {action.capitalize()}\n**Repository:** {repo_full_name}\n[View PR]({url})"
-        if handler_name:
-            embed.set_footer(text=f"Handled by: {handler_name}")
-        embed.set_author(name="GitHub Watcher", icon_url="https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png")
-        embed.timestamp = discord.utils.utcnow()
-        logging.info(f"Built embed for pull_request event: {key}")
-
-    elif kind == "issue_comment":
-        # Building an embed for an issue comment event
-        commenter = data.get("user", "unknown")
-        comment_body = data.get("body", "")
-        comment_url = data.get("url", "#")
-        repo_full_name = data.get("repo_full_name", "unknown/unknown")
-        emoji = "💬"
-        color = Color.blue()
-        embed.color = color
-        embed.title = f"{emoji} Issue Comment by {commenter}"
-        embed.url = comment_url
-        embed.description = f"**Comment:** {comment_body}\n[View Comment]({comment_url})"
-        if handler_name:
-            embed.set_footer(text=f"Handled by: {handler_name}")
-        embed.set_author(name="GitHub Watcher", icon_url="https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png")
-        embed.timestamp = discord.utils.utcnow()
-        logging.info(f"Built embed for issue_comment event: {key}")
-
-    elif kind == "commit_comment":
-        # Building an embed for a commit comment event
-        commit_sha = data.get("commit_sha", "unknown")
-        commenter = data.get("commenter", "unknown")
-        comment_url = data.get("url", "#")
-        body = data.get("body", "")
-        repo_full_name = data.get("repo_full_name", "unknown/unknown")
-        emoji = "💬"
-        color, emoji = get_color_and_emoji("commented")
-        embed.color = color
-        embed.title = f"{emoji} Commit Comment by {commenter}"
-        embed.url = comment_url
-        embed.description = (
-            f"**Commit SHA:** [{commit_sha[:7]}](https://github.com/{repo_full_name}/commit/{commit_sha})\n"
-            f"**Commenter:** {commenter}\n"
-            f"**Comment:** {body[:80]}...\n[View Comment]({comment_url})"
-        )
-        if handler_name:
-            embed.set_footer(text=f"Handled by: {handler_name}")
-        embed.set_author(name="GitHub Watcher", icon_url="https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png")
-        embed.timestamp = discord.utils.utcnow()
-        logging.info(f"Built embed for commit_comment event: {key}")
-
-    elif kind == "check_run":
-        # Building an embed for a check run event
-        name = data.get("name", "Unnamed Check")
-        url = data.get("url", "#")
-        status = data.get("status", "unknown")
-        conclusion = data.get("conclusion", "unknown")
-        repo_full_name = data.get("repo_full_name", "unknown/unknown")
-        overall_status = conclusion if status == "completed" else status
-        color, emoji = get_color_and_emoji(overall_status)
-        embed.color = color
-        embed.title = f"{emoji} Check Run: {name}"
-        embed.url = url
-        embed.description = f"**Status:** {overall_status.capitalize()}\n[View Check Run]({url})"
-        if handler_name:
-            embed.set_footer(text=f"Handled by: {handler_name}")
-        embed.set_author(name="GitHub Watcher", icon_url="https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png")
-        embed.timestamp = discord.utils.utcnow()
-        logging.info(f"Built embed for check_run event: {key}")
-
-    elif kind == "check_suite":
-        # Building an embed for a check suite event
-        name = data.get("name", "Unnamed Check Suite")
-        url = data.get("url", "#")
-        status = data.get("status", "unknown")
-        conclusion = data.get("conclusion", "unknown")
-        repo_full_name = data.get("repo_full_name", "unknown/unknown")
-        overall_status = conclusion if status == "completed" else status
-        color, emoji = get_color_and_emoji(overall_status)
-        embed.color = color
-        embed.title = f"{emoji} Check Suite: {name}"
-        embed.url = url
-        embed.description = f"**Status:** {overall_status.capitalize()}\n[View Check Suite]({url})"
-        if handler_name:
-            embed.set_footer(text=f"Handled by: {handler_name}")
-        embed.set_author(name="GitHub Watcher", icon_url="https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png")
-        embed.timestamp = discord.utils.utcnow()
-        logging.info(f"Built embed for check_suite event: {key}")
-
-    elif kind == "workflow_run":
-        # Building an embed for a workflow run event
-        name = data.get("name", "Unnamed Workflow")
-        url = data.get("url", "#")
-        status = data.get("status", "unknown")
-        conclusion = data.get("conclusion", "unknown")
-        repo_full_name = data.get("repo_full_name", "unknown/unknown")
-        overall_status = conclusion if status == "completed" else status
-        color, emoji = get_color_and_emoji(overall_status)
-        embed.color = color
-        embed.title = f"{emoji} Workflow Run: {name}"
-        embed.url = url
-        embed.description = f"**Status:** {overall_status.capitalize()}\n[View Workflow Run]({url})"
-        if handler_name:
-            embed.set_footer(text=f"Handled by: {handler_name}")
-        embed.set_author(name="GitHub Watcher", icon_url="https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png")
-        embed.timestamp = discord.utils.utcnow()
-        logging.info(f"Built embed for workflow_run event: {key}")
-
-    elif kind == "workflow_job":
-        # Building an embed for a workflow job event
-        name = data.get("name", "Unnamed Workflow Job")
-        url = data.get("url", "#")
-        status = data.get("status", "unknown")
-        conclusion = data.get("conclusion", "unknown")
-        repo_full_name = data.get("repo_full_name", "unknown/unknown")
-        overall_status = conclusion if status == "completed" else status
-        color, emoji = get_color_and_emoji(overall_status)
-        embed.color = color
-        embed.title = f"{emoji} Workflow Job: {name}"
-        embed.url = url
-        embed.description = f"**Status:** {overall_status.capitalize()}\n[View Workflow Job]({url})"
-        if handler_name:
-            embed.set_footer(text=f"Handled by: {handler_name}")
-        embed.set_author(name="GitHub Watcher", icon_url="https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png")
-        embed.timestamp = discord.utils.utcnow()
-        logging.info(f"Built embed for workflow_job event: {key}")
-
-    elif kind == "create":
-        # Building an embed for a create event (branch or tag creation)
-        ref_type = data.get("ref_type", "unknown")
-        ref = data.get("ref", "unknown")
-        user = data.get("user", "unknown")
-        ref_url = data.get("ref_url", "#")
-        repo_full_name = data.get("repo_full_name", "unknown/unknown")
-
-        emoji = "➕" if ref_type == "branch" else "🏷️"
-        color = Color.green() if ref_type == "branch" else Color.blue()
-
-        embed.color = color
-        embed.title = f"{emoji} {ref_type.capitalize()} Created: {ref}"
-        if ref_url != "#":
-            embed.url = ref_url  # Makes the title a hyperlink to the ref
-
-        desc = f"**Type:** {ref_type.capitalize()}\n**Reference:** {ref}\n**Created By:** {user}\n[View {ref_type.capitalize()}]({ref_url})"
-        embed.description = desc
-
-        if handler_name:
-            embed.set_footer(text=f"Handled by: {handler_name}")
-
-        embed.set_author(name="GitHub Watcher", icon_url="https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png")
-        embed.timestamp = discord.utils.utcnow()
-
-        logging.info(f"Built embed for create event: {key}")
-
-    elif kind == "delete":
-        # Building an embed for a delete event (branch or tag deletion)
-        ref_type = data.get("ref_type", "unknown")
-        ref = data.get("ref", "unknown")
-        user = data.get("user", "unknown")
-        ref_url = data.get("ref_url", "#")
-        repo_full_name = data.get("repo_full_name", "unknown/unknown")
-
-        emoji = "➖" if ref_type == "branch" else "🏷️"
-        color = Color.red() if ref_type == "branch" else Color.dark_blue()
-
-        embed.color = color
-        embed.title = f"{emoji} {ref_type.capitalize()} Deleted: {ref}"
-        if ref_url != "#":
-            embed.url = ref_url  # Makes the title a hyperlink to the ref (if possible)
-
-        desc = f"**Type:** {ref_type.capitalize()}\n**Reference:** {ref}\n**Deleted By:** {user}\n[View {ref_type.capitalize()}]({ref_url})"
-        embed.description = desc
-
-        if handler_name:
-            embed.set_footer(text=f"Handled by: {handler_name}")
-
-        embed.set_author(name="GitHub Watcher", icon_url="https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png")
-        embed.timestamp = discord.utils.utcnow()
-
-        logging.info(f"Built embed for delete event: {key}")
-
-    elif kind == "fork":
-        # Building an embed for a fork event
-        sender = data.get("sender", "unknown")
-        repo_name = data.get("repo_name", "unknown/unknown")
-        forkee_name = data.get("forkee_name", "unknown")
-        forkee_url = data.get("forkee_url", "#")
-        repo_full_name = data.get("repo_full_name", "unknown/unknown")
-
-        emoji = "🍴"
-        color = Color.gold()
-
-        embed.color = color
-        embed.title = f"{emoji} Repository Forked by {sender}"
-        embed.url = forkee_url
-        embed.description = (
-            f"**Original Repository:** {repo_name}\n"
-            f"**Forked Repository:** [{forkee_name}]({forkee_url})\n"
-            f"[View Fork]({forkee_url})"
-        )
-        if handler_name:
-            embed.set_footer(text=f"Handled by: {handler_name}")
-        embed.set_author(name="GitHub Watcher", icon_url="https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png")
-        embed.timestamp = discord.utils.utcnow()
-
-        logging.info(f"Built embed for fork event: {key}")
-
-    elif kind == "release":
-        # Building an embed for a release event
-        action = data.get("action", "unknown")
-        name = data.get("name", "No Name")
-        url = data.get("url", "#")
-        publisher = data.get("publisher", "unknown")
-        repo_full_name = data.get("repo_full_name", "unknown/unknown")
-
-        emoji = "📦"
-        color = Color.blue()
-
-        embed.color = color
-        embed.title = f"{emoji} Release {action.capitalize()}: {name}"
-        embed.url = url
-        embed.description = (
-            f"**Name:** {name}\n"
-            f"**Action:** {action.capitalize()}\n"
-            f"**Publisher:** {publisher}\n"
-            f"[View Release]({url})"
-        )
-        if handler_name:
-            embed.set_footer(text=f"Handled by: {handler_name}")
-        embed.set_author(name="GitHub Watcher", icon_url="https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png")
-        embed.timestamp = discord.utils.utcnow()
-
-        logging.info(f"Built embed for release event: {key}")
-
-    elif kind == "repository":
-        # Building an embed for a repository event
-        action = data.get("action", "unknown")
-        repo_name = data.get("name", "unknown")
-        repo_url = data.get("url", "#")
-        owner = data.get("owner", "unknown")
-        repo_full_name = data.get("repo_full_name", "unknown/unknown")
-
-        emoji = "🏠"
-        color = Color.greyple()
-
-        embed.color = color
-        embed.title = f"{emoji} Repository {action.capitalize()}: {repo_name}"
-        embed.url = repo_url
-        embed.description = (
-            f"**Repository:** [{repo_name}]({repo_url})\n"
-            f"**Action:** {action.capitalize()}\n"
-            f"**Owner:** {owner}\n"
-            f"[View Repository]({repo_url})"
-        )
-        if handler_name:
-            embed.set_footer(text=f"Handled by: {handler_name}")
-        embed.set_author(name="GitHub Watcher", icon_url="https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png")
-        embed.timestamp = discord.utils.utcnow()
-
-        logging.info(f"Built embed for repository event: {key}")
-
-    elif kind == "watch":
-        # Building an embed for a watch/star event
-        user = data.get("user", "unknown")
-        repo_name = data.get("repo_name", "unknown")
-        repo_url = data.get("repo_url", "#")
-        action = data.get("action", "starred")
-        repo_full_name = data.get("repo_full_name", "unknown/unknown")
-
-        emoji = "⭐"
-        color = Color.gold()
-
-        embed.color = color
-        embed.title = f"{emoji} {action.capitalize()} Repository"
-        embed.url = repo_url
-        embed.description = (
-            f"**User:** {user}\n"
-            f"**Repository:** [{repo_name}]({repo_url})\n"
-            f"[View Repository]({repo_url})"
-        )
-        if handler_name:
-            embed.set_footer(text=f"Handled by: {handler_name}")
-        embed.set_author(name="GitHub Watcher", icon_url="https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png")
-        embed.timestamp = discord.utils.utcnow()
-
-        logging.info(f"Built embed for watch event: {key}")
-
-    elif kind == "member":
-        # Building an embed for a member event
-        member_login = data.get("member_login", "unknown")
-        action = data.get("action", "unknown")
-        repo_full_name = data.get("repo_full_name", "unknown/unknown")
-        repo_url = data.get("repo_url", "#")
-
-        emoji = "👥"
-        color = Color.purple()
-
-        embed.color = color
-        embed.title = f"{emoji} Member {action.capitalize()}"
-        embed.url = repo_url
-        embed.description = (
-            f"**Member:** {member_login}\n"
-            f"**Action:** {action.capitalize()}\n"
-            f"**Repository:** [{repo_full_name}]({repo_url})\n"
-            f"[View Repository]({repo_url})"
-        )
-        if handler_name:
-            embed.set_footer(text=f"Handled by: {handler_name}")
-        embed.set_author(name="GitHub Watcher", icon_url="https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png")
-        embed.timestamp = discord.utils.utcnow()
-
-        logging.info(f"Built embed for member event: {key}")
+    embed = Embed(color=_C_BLURPLE)  # Default color
+    builder = _BUILDERS.get(kind, _build_other)
+    builder(embed, data)
+    _finalize(embed, handler_name, now=now)
 
-    else:
-        # Handling Unexpected Events
-        embed.title = "⚙️ Other Event"
-        embed.description = "No detailed storage for this event."
-        embed.color = Color.greyple()
-        embed.set_author(name="GitHub Watcher", icon_url="https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png")
-
-        if handler_name:
-            embed.set_footer(text=f"Handled by: {handler_name}")
-
-        try:
-            json_payload = json.dumps(data, indent=2)
-            if len(json_payload) > 1800:
-                json_payload = json_payload[:1800] + "...\n```json\n[Truncated]"
-            embed.add_field(name="Event Payload", value=f"```json\n{json_payload}```", inline=False)
-        except Exception as e:
-            embed.add_field(name="Error", value=f"Failed to serialize event payload: {e}", inline=False)
-
-        embed.timestamp = discord.utils.utcnow()
-
-        logging.info(f"Built embed for other event: {key}")
+    logger.debug("Built embed for %s event: %s", kind, key)
 
     return embed
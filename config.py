@@ -6,6 +6,37 @@ from dotenv import load_dotenv
 # Load environment variables from a .env file if present
 load_dotenv()
 
+# Values accepted as "true" for boolean environment variables (case-insensitive)
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on", "y", "t"})
+
+def _env_bool(name, default=False):
+    """
+    Reads a boolean flag from the environment.
+
+    Parameters:
+    - name (str): The environment variable name.
+    - default (bool): Value used when the variable is not set.
+
+    Returns:
+    - bool: True if the variable is set to a recognised true value.
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUE_VALUES
+
+def _env_list(name):
+    """
+    Reads a comma-separated list from the environment.
+
+    Parameters:
+    - name (str): The environment variable name.
+
+    Returns:
+    - list: The non-empty, stripped items, or an empty list if the variable is not set.
+    """
+    return [item.strip() for item in os.getenv(name, "").split(",") if item.strip()]
+
 class Config:
     """
     Configuration class that holds all the necessary settings for the application.
@@ -21,9 +52,12 @@ class Config:
     # GitHub Webhook Secret for verifying incoming requests
     GITHUB_WEBHOOK_SECRET = os.getenv('GITHUB_WEBHOOK_SECRET')
 
+    # Networks (CIDR notation) whose webhook requests skip signature verification
+    TRUSTED_CIDRS = _env_list('TRUSTED_CIDRS')
+
     # Additional Configuration Flags
-    SEND_UNEXPECTED_EVENTS = os.getenv('SEND_UNEXPECTED_EVENTS', 'False').lower() in ['true', '1', 'yes']
-    INCLUDE_HANDLER_INFO = os.getenv('INCLUDE_HANDLER_INFO', 'False').lower() in ['true', '1', 'yes']
+    SEND_UNEXPECTED_EVENTS = _env_bool('SEND_UNEXPECTED_EVENTS')
+    INCLUDE_HANDLER_INFO = _env_bool('INCLUDE_HANDLER_INFO')
 
     # File path for data persistence
     DATA_STORE_FILE = os.getenv('DATA_STORE_FILE', "data_store.json")
@@ -2,11 +2,32 @@
 
 import hmac
 import hashlib
+import ipaddress
 import json
 import logging
 from flask import Flask, request, abort
 
-def create_flask_app(config, data_persistence, github_handlers):
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Webhook bodies are parsed with orjson when it is installed
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# "sha256=" followed by the 64 hex digits of the digest
+_SIGNATURE_LENGTH = 71
+
+# GitHub caps webhook payloads at 25 MB
+_MAX_PAYLOAD_SIZE = 25 * 1024 * 1024
+
+# Seconds a request waits for startup (loading the data and starting the Discord bot's
+# event loop) to finish; GitHub gives up on deliveries after 10
+_READY_TIMEOUT = 5
+
+def create_flask_app(config, data_persistence, github_handlers, ready_event=None):
     """
     Factory function to create and configure the Flask application.
 
@@ -14,41 +35,85 @@ def create_flask_app(config, data_persistence, github_handlers):
     - config (Config): Configuration instance.
     - data_persistence (DataPersistence): Data persistence instance.
     - github_handlers (GitHubHandlers): GitHub event handlers.
+    - ready_event (threading.Event, optional): Set once the application can process events.
+      Requests arriving before then wait briefly and are answered with 503 if it is still unset.
 
     Returns:
     - Flask: The configured Flask application.
     """
     app = Flask(__name__)
+    # Refuse bodies above GitHub's payload cap before they are read or hashed
+    app.config["MAX_CONTENT_LENGTH"] = _MAX_PAYLOAD_SIZE
+
+    # Key the HMAC once; each request hashes into a copy of this template
+    hmac_template = None
+    if config.GITHUB_WEBHOOK_SECRET:
+        hmac_template = hmac.new(config.GITHUB_WEBHOOK_SECRET.encode(), digestmod=hashlib.sha256)
 
-    def verify_signature(req):
+    # Requests from these networks are trusted without a signature
+    trusted_networks = tuple(ipaddress.ip_network(cidr, strict=False) for cidr in config.TRUSTED_CIDRS)
+
+    def is_trusted_peer(req):
         """
-        Verifies the GitHub webhook signature to ensure the request is legitimate.
+        Checks whether the request comes directly from a trusted network.
 
         Parameters:
         - req (flask.Request): The incoming Flask request.
 
         Returns:
-        - bool: True if the signature is valid or no secret is set, False otherwise.
+        - bool: True if the peer address lies in one of the TRUSTED_CIDRS networks.
         """
-        if not config.GITHUB_WEBHOOK_SECRET:
-            # If no secret is set, skip verification
-            return True
-        signature = req.headers.get('X-Hub-Signature-256')
-        if not signature:
+        if not trusted_networks or not req.remote_addr:
             return False
         try:
-            sha_name, received_sig = signature.split('=')
+            address = ipaddress.ip_address(req.remote_addr)
         except ValueError:
             return False
-        if sha_name != 'sha256':
-            return False
-        mac = hmac.new(
-            config.GITHUB_WEBHOOK_SECRET.encode(),
-            msg=req.data,
-            digestmod='sha256'
-        )
-        expected_sig = mac.hexdigest()
-        return hmac.compare_digest(received_sig, expected_sig)
+        return any(address in network for network in trusted_networks)
+
+    def read_verified_body(req):
+        """
+        Reads the request body and verifies the GitHub webhook signature to ensure the
+        request is legitimate.
+
+        Parameters:
+        - req (flask.Request): The incoming Flask request.
+
+        Returns:
+        - bytes or None: The request body if the signature is valid, no secret is set or the peer is trusted, None otherwise.
+        """
+        if hmac_template is None or is_trusted_peer(req):
+            # If no secret is set or the peer is trusted, skip verification
+            return req.get_data()
+        signature = req.headers.get('X-Hub-Signature-256')
+        # Reject malformed headers before reading the body
+        if not signature or len(signature) != _SIGNATURE_LENGTH or not signature.startswith('sha256='):
+            return None
+        try:
+            received_sig = bytes.fromhex(signature[7:])
+        except ValueError:
+            return None
+        # bytes.fromhex skips whitespace, so a padded header can decode short
+        if len(received_sig) != hmac_template.digest_size:
+            return None
+        # The server has already buffered the whole body, so hash the bytes get_data caches
+        # on the request instead of assembling another copy from the stream
+        body = req.get_data()
+        mac = hmac_template.copy()
+        mac.update(body)
+        if not hmac.compare_digest(received_sig, mac.digest()):
+            return None
+        return body
+
+    @app.before_request
+    def wait_until_ready():
+        """
+        Holds requests until the application is ready, answering 503 Service Unavailable
+        if startup takes longer than _READY_TIMEOUT seconds.
+        """
+        if ready_event is not None and not ready_event.wait(_READY_TIMEOUT):
+            logger.warning("Rejecting request received before startup finished.")
+            abort(503, "Starting up")
 
     @app.route("/github-webhook", methods=['POST'])
     def github_webhook():
@@ -61,20 +126,30 @@ def create_flask_app(config, data_persistence, github_handlers):
         Raises:
         - 403 Forbidden: If the signature verification fails.
         """
-        if not verify_signature(request):
-            logging.warning("Invalid signature for incoming webhook.")
+        body = read_verified_body(request)
+        if body is None:
+            logger.warning("Invalid signature for incoming webhook.")
             abort(403, "Invalid signature")
 
         event_type = request.headers.get('X-GitHub-Event', 'unknown')
-        payload = request.json or {}
+        try:
+            payload = (_json_loads(body) if body else None) or {}
+        except ValueError:
+            logger.warning("Invalid JSON payload for event: %s", event_type)
+            abort(400, "Invalid JSON payload")
 
-        logging.info(f"Received event: {event_type}")
-        logging.debug(f"Payload: {json.dumps(payload, indent=2)}")
+        logger.info("Received event: %s", event_type)
+        # Only serialize the payload when debug logging is actually enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            if orjson is not None:
+                logger.debug("Payload: %s", orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode())
+            else:
+                logger.debug("Payload: %s", json.dumps(payload, indent=2))
 
         try:
             github_handlers.handle_event(event_type, payload)
         except Exception as e:
-            logging.error(f"Error handling event '{event_type}': {e}")
+            logger.error("Error handling event '%s': %s", event_type, e)
             # Optionally, implement error handling here
 
         return "OK", 200
@@ -1,7 +1,22 @@
 # handlers/github_handlers.py
 
 import asyncio
+import collections
+import functools
 import logging
+import threading
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+# Shared read-only stand-in for missing or null payload objects
+_EMPTY = MappingProxyType({})
+
+# Page URL templates for created or deleted refs, filled with (repo_full_name, ref)
+_REF_URL_TEMPLATES = {
+    "branch": "https://github.com/%s/tree/%s",
+    "tag": "https://github.com/%s/releases/tag/%s",
+}
 
 class GitHubHandlers:
     """
@@ -18,6 +33,12 @@ class GitHubHandlers:
         """
         self.data_persistence = data_persistence
         self.discord_bot = discord_bot
+        self._pending_updates = collections.deque()
+        self._pending_lock = threading.Lock()
+        self._drain_scheduled = False
+        self._update_tasks = set()
+        # Updates queued before the bot's event loop started are delivered once it runs
+        discord_bot.add_startup_callback(self._drain_pending_updates)
         self.EVENT_HANDLERS = {
             "push": self.handle_push,
             "check_run": self.handle_check_run,
@@ -30,8 +51,8 @@ class GitHubHandlers:
             "pull_request_review_comment": self.handle_pull_request_review_comment,
             "issues": self.handle_issues,
             "issue_comment": self.handle_issue_comment,
-            "create": self.handle_create,
-            "delete": self.handle_delete,
+            "create": functools.partial(self._handle_ref_change, kind="create"),
+            "delete": functools.partial(self._handle_ref_change, kind="delete"),
             "fork": self.handle_fork,
             "release": self.handle_release,
             "watch": self.handle_watch,
@@ -51,12 +72,86 @@ class GitHubHandlers:
         """
         handler = self.EVENT_HANDLERS.get(event_type)
         if handler:
-            logging.info(f"Handling event: {event_type}")
+            logger.info("Handling event: %s", event_type)
             handler(payload)
         else:
-            logging.warning(f"No handler found for event type: {event_type}")
+            logger.warning("No handler found for event type: %s", event_type)
             # Optionally handle unexpected events here
 
+    @staticmethod
+    def _repo(payload):
+        """
+        Looks up the repository object of a webhook payload.
+
+        Parameters:
+        - payload (dict): The webhook payload (or a nested object carrying a repository).
+
+        Returns:
+        - Mapping: The repository object, or an empty read-only mapping if it is missing.
+        """
+        return payload.get("repository") or _EMPTY
+
+    @staticmethod
+    def _sender(payload):
+        """
+        Looks up the login of the user who triggered a webhook event.
+
+        Parameters:
+        - payload (dict): The webhook payload.
+
+        Returns:
+        - str: The sender's login, or "unknown" if the payload has no sender.
+        """
+        return (payload.get("sender") or _EMPTY).get("login", "unknown")
+
+    def _publish(self, key, data, handler_name):
+        """
+        Stores the extracted event data and queues the matching Discord update.
+
+        Parameters:
+        - key (str): The unique key for the data entry.
+        - data (dict): The data extracted from the webhook payload.
+        - handler_name (str): The name of the event handler that processed this event.
+        """
+        self.data_persistence.update_data_store(key, data)
+        self._notify(key, handler_name)
+
+    def _notify(self, key, handler_name):
+        """
+        Queues a Discord update for the key. Called from webhook threads; the Discord
+        event loop is woken at most once per batch of queued updates. If the loop is not
+        running, the update stays queued until the next wakeup succeeds.
+
+        Parameters:
+        - key (str): The unique key for the data entry.
+        - handler_name (str): The name of the event handler that processed this event.
+        """
+        self._pending_updates.append((key, handler_name))
+        with self._pending_lock:
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        try:
+            self.discord_bot.bot.loop.call_soon_threadsafe(self._drain_pending_updates)
+        except (AttributeError, RuntimeError) as e:
+            # bot.loop raises AttributeError before login and a closed loop raises RuntimeError
+            with self._pending_lock:
+                self._drain_scheduled = False
+            logger.warning("Discord event loop is not running, keeping update for %s queued: %s", key, e)
+
+    def _drain_pending_updates(self):
+        """
+        Runs on the Discord event loop and starts a send_or_edit for every queued update.
+        """
+        with self._pending_lock:
+            self._drain_scheduled = False
+        while self._pending_updates:
+            key, handler_name = self._pending_updates.popleft()
+            task = asyncio.ensure_future(self.discord_bot.send_or_edit(key, handler_name=handler_name))
+            # Keep a reference so the task is not garbage collected while pending
+            self._update_tasks.add(task)
+            task.add_done_callback(self._update_tasks.discard)
+
     def handle_push(self, payload):
         """
         Handles the 'push' event from GitHub.
@@ -64,24 +159,30 @@ class GitHubHandlers:
         Parameters:
         - payload (dict): The webhook payload containing push information.
         """
-        commits = payload.get("commits", [])
-        repo = payload.get("repository", {})
+        commits = payload.get("commits") or []
+        if not commits:
+            return
+        repo = self._repo(payload)
         repo_full_name = repo.get("full_name", "unknown/unknown")
-        for commit in commits:
-            sha = commit.get("id", "")
-            message = commit.get("message", "")
-            url = commit.get("url", "#")
-            key = f"push:{sha}"
-            commit_data = {
-                "message": message,
-                "url": url,
-                "repo_full_name": repo_full_name
-            }
-            self.data_persistence.update_data_store(key, commit_data)
-            asyncio.run_coroutine_threadsafe(
-                self.discord_bot.send_or_edit(key, handler_name="push"),
-                self.discord_bot.bot.loop
-            )
+
+        # One entry and one Discord update per push, keyed by the head commit
+        head = commits[-1]
+        key = f"push:{head.get('id', '')}"
+        push_data = {
+            "message": head.get("message", ""),
+            "url": head.get("url", "#"),
+            "compare_url": payload.get("compare", "#"),
+            "repo_full_name": repo_full_name,
+            "commits": [
+                {
+                    "id": commit.get("id", ""),
+                    "message": commit.get("message", ""),
+                    "url": commit.get("url", "#")
+                }
+                for commit in commits
+            ]
+        }
+        self._publish(key, push_data, "push")
 
     def handle_check_run(self, payload):
         """
@@ -90,14 +191,14 @@ class GitHubHandlers:
         Parameters:
         - payload (dict): The webhook payload containing check run information.
         """
-        check_run = payload.get("check_run", {})
+        check_run = payload.get("check_run") or _EMPTY
         run_id = str(check_run.get("id", "unknown"))
         name = check_run.get("name", "Unnamed Check")
         url = check_run.get("html_url", "#")
         status = check_run.get("status", "unknown")
         conclusion = check_run.get("conclusion", "unknown")
         head_sha = check_run.get("head_sha", "unknown")
-        repo_full_name = payload.get("repository", {}).get("full_name", "unknown/unknown")
+        repo_full_name = self._repo(payload).get("full_name", "unknown/unknown")
         key = f"check_run:{run_id}"
         check_run_data = {
             "name": name,
@@ -107,11 +208,7 @@ class GitHubHandlers:
             "head_sha": head_sha,
             "repo_full_name": repo_full_name
         }
-        self.data_persistence.update_data_store(key, check_run_data)
-        asyncio.run_coroutine_threadsafe(
-            self.discord_bot.send_or_edit(key, handler_name="check_run"),
-            self.discord_bot.bot.loop
-        )
+        self._publish(key, check_run_data, "check_run")
 
     def handle_check_suite(self, payload):
         """
@@ -120,14 +217,14 @@ class GitHubHandlers:
         Parameters:
         - payload (dict): The webhook payload containing check suite information.
         """
-        check_suite = payload.get("check_suite", {})
+        check_suite = payload.get("check_suite") or _EMPTY
         suite_id = str(check_suite.get("id", "unknown"))
         name = check_suite.get("name", "Unnamed Check Suite")
         url = check_suite.get("html_url", "#")
         status = check_suite.get("status", "unknown")
         conclusion = check_suite.get("conclusion", "unknown")
         head_sha = check_suite.get("head_sha", "unknown")
-        repo_full_name = check_suite.get("repository", {}).get("full_name", "unknown/unknown")
+        repo_full_name = self._repo(check_suite).get("full_name", "unknown/unknown")
         key = f"check_suite:{suite_id}"
         check_suite_data = {
             "name": name,
@@ -137,11 +234,7 @@ class GitHubHandlers:
             "head_sha": head_sha,
             "repo_full_name": repo_full_name
         }
-        self.data_persistence.update_data_store(key, check_suite_data)
-        asyncio.run_coroutine_threadsafe(
-            self.discord_bot.send_or_edit(key, handler_name="check_suite"),
-            self.discord_bot.bot.loop
-        )
+        self._publish(key, check_suite_data, "check_suite")
 
     def handle_workflow_run(self, payload):
         """
@@ -150,12 +243,12 @@ class GitHubHandlers:
         Parameters:
         - payload (dict): The webhook payload containing workflow run information.
         """
-        workflow_run = payload.get("workflow_run", {})
+        workflow_run = payload.get("workflow_run") or _EMPTY
         action = payload.get("action", "")
 
         if action != "completed":
             # Only process workflow runs that have completed
-            logging.info(f"Ignored workflow_run action: {action}")
+            logger.info("Ignored workflow_run action: %s", action)
             return
 
         run_id = str(workflow_run.get("id", "unknown"))
@@ -166,7 +259,7 @@ class GitHubHandlers:
         started_at = workflow_run.get("started_at", "")
         completed_at = workflow_run.get("completed_at", "")
         head_sha = workflow_run.get("head_sha", "unknown")
-        repo_full_name = workflow_run.get("repository", {}).get("full_name", "unknown/unknown")
+        repo_full_name = self._repo(workflow_run).get("full_name", "unknown/unknown")
 
         key = f"workflow_run:{run_id}"
         workflow_run_data = {
@@ -179,11 +272,7 @@ class GitHubHandlers:
             "head_sha": head_sha,
             "repo_full_name": repo_full_name
         }
-        self.data_persistence.update_data_store(key, workflow_run_data)
-        asyncio.run_coroutine_threadsafe(
-            self.discord_bot.send_or_edit(key, handler_name="workflow_run"),
-            self.discord_bot.bot.loop
-        )
+        self._publish(key, workflow_run_data, "workflow_run")
 
     def handle_workflow_job(self, payload):
         """
@@ -192,14 +281,14 @@ class GitHubHandlers:
         Parameters:
         - payload (dict): The webhook payload containing workflow job information.
         """
-        workflow_job = payload.get("workflow_job", {})
+        workflow_job = payload.get("workflow_job") or _EMPTY
         job_id = str(workflow_job.get("id", "unknown"))
         name = workflow_job.get("name", "Unnamed Workflow Job")
         url = workflow_job.get("html_url", "#")
         status = workflow_job.get("status", "unknown")
         conclusion = workflow_job.get("conclusion", "unknown")
         head_sha = workflow_job.get("head_sha", "unknown")
-        repo_full_name = workflow_job.get("repository", {}).get("full_name", "unknown/unknown")
+        repo_full_name = self._repo(workflow_job).get("full_name", "unknown/unknown")
 
         key = f"workflow_job:{job_id}"
         workflow_job_data = {
@@ -210,11 +299,7 @@ class GitHubHandlers:
             "head_sha": head_sha,
             "repo_full_name": repo_full_name
         }
-        self.data_persistence.update_data_store(key, workflow_job_data)
-        asyncio.run_coroutine_threadsafe(
-            self.discord_bot.send_or_edit(key, handler_name="workflow_job"),
-            self.discord_bot.bot.loop
-        )
+        self._publish(key, workflow_job_data, "workflow_job")
 
     def handle_pull_request(self, payload):
         """
@@ -223,13 +308,13 @@ class GitHubHandlers:
         Parameters:
         - payload (dict): The webhook payload containing pull request information.
         """
-        pr = payload.get("pull_request", {})
+        pr = payload.get("pull_request") or _EMPTY
         action = payload.get("action", "unknown")
         pr_number = pr.get("number", 0)
         title = pr.get("title", "")
         url = pr.get("html_url", "#")
         merged = pr.get("merged", False)
-        repo_full_name = payload.get("repository", {}).get("full_name", "unknown/unknown")
+        repo_full_name = self._repo(payload).get("full_name", "unknown/unknown")
 
         key = f"pull_request:{pr_number}"
         pr_data = {
@@ -239,11 +324,7 @@ class GitHubHandlers:
             "merged": merged,
             "repo_full_name": repo_full_name
         }
-        self.data_persistence.update_data_store(key, pr_data)
-        asyncio.run_coroutine_threadsafe(
-            self.discord_bot.send_or_edit(key, handler_name="pull_request"),
-            self.discord_bot.bot.loop
-        )
+        self._publish(key, pr_data, "pull_request")
 
     def handle_pull_request_review(self, payload):
         """
@@ -252,14 +333,14 @@ class GitHubHandlers:
         Parameters:
         - payload (dict): The webhook payload containing pull request review information.
         """
-        review = payload.get("review", {})
-        pr = payload.get("pull_request", {})
+        review = payload.get("review") or _EMPTY
+        pr = payload.get("pull_request") or _EMPTY
         pr_number = pr.get("number", 0)
-        reviewer = review.get("user", {}).get("login", "unknown")
+        reviewer = (review.get("user") or _EMPTY).get("login", "unknown")
         url = review.get("html_url", "#")
         action = review.get("state", "commented")
         body = review.get("body", "")
-        repo_full_name = payload.get("repository", {}).get("full_name", "unknown/unknown")
+        repo_full_name = self._repo(payload).get("full_name", "unknown/unknown")
 
         key = f"pull_request_review:{pr_number}:{reviewer}:{url}"
         review_data = {
@@ -269,11 +350,7 @@ class GitHubHandlers:
             "body": body,
             "repo_full_name": repo_full_name
         }
-        self.data_persistence.update_data_store(key, review_data)
-        asyncio.run_coroutine_threadsafe(
-            self.discord_bot.send_or_edit(key, handler_name="pull_request_review"),
-            self.discord_bot.bot.loop
-        )
+        self._publish(key, review_data, "pull_request_review")
 
     def handle_pull_request_review_comment(self, payload):
         """
@@ -282,13 +359,13 @@ class GitHubHandlers:
         Parameters:
         - payload (dict): The webhook payload containing pull request review comment information.
         """
-        comment = payload.get("comment", {})
-        pr = payload.get("pull_request", {})
+        comment = payload.get("comment") or _EMPTY
+        pr = payload.get("pull_request") or _EMPTY
         pr_number = pr.get("number", 0)
-        commenter = comment.get("user", {}).get("login", "unknown")
+        commenter = (comment.get("user") or _EMPTY).get("login", "unknown")
         comment_url = comment.get("html_url", "#")
         body = comment.get("body", "")
-        repo_full_name = payload.get("repository", {}).get("full_name", "unknown/unknown")
+        repo_full_name = self._repo(payload).get("full_name", "unknown/unknown")
 
         key = f"pull_request_review_comment:{pr_number}:{commenter}:{comment_url}"
         comment_data = {
@@ -297,11 +374,7 @@ class GitHubHandlers:
             "body": body,
             "repo_full_name": repo_full_name
         }
-        self.data_persistence.update_data_store(key, comment_data)
-        asyncio.run_coroutine_threadsafe(
-            self.discord_bot.send_or_edit(key, handler_name="pull_request_review_comment"),
-            self.discord_bot.bot.loop
-        )
+        self._publish(key, comment_data, "pull_request_review_comment")
 
     def handle_issues(self, payload):
         """
@@ -310,12 +383,12 @@ class GitHubHandlers:
         Parameters:
         - payload (dict): The webhook payload containing issue information.
         """
-        issue = payload.get("issue", {})
+        issue = payload.get("issue") or _EMPTY
         action = payload.get("action", "unknown")
         issue_number = issue.get("number", 0)
         title = issue.get("title", "")
         url = issue.get("html_url", "#")
-        repo_full_name = payload.get("repository", {}).get("full_name", "unknown/unknown")
+        repo_full_name = self._repo(payload).get("full_name", "unknown/unknown")
 
         key = f"issue:{issue_number}:{action}"
         issue_data = {
@@ -324,11 +397,7 @@ class GitHubHandlers:
             "action": action,
             "repo_full_name": repo_full_name
         }
-        self.data_persistence.update_data_store(key, issue_data)
-        asyncio.run_coroutine_threadsafe(
-            self.discord_bot.send_or_edit(key, handler_name="issues"),
-            self.discord_bot.bot.loop
-        )
+        self._publish(key, issue_data, "issues")
 
     def handle_issue_comment(self, payload):
         """
@@ -337,13 +406,13 @@ class GitHubHandlers:
         Parameters:
         - payload (dict): The webhook payload containing issue comment information.
         """
-        comment = payload.get("comment", {})
-        issue = payload.get("issue", {})
+        comment = payload.get("comment") or _EMPTY
+        issue = payload.get("issue") or _EMPTY
         issue_number = issue.get("number", 0)
-        commenter = comment.get("user", {}).get("login", "unknown")
+        commenter = (comment.get("user") or _EMPTY).get("login", "unknown")
         comment_url = comment.get("html_url", "#")
         body = comment.get("body", "")
-        repo_full_name = payload.get("repository", {}).get("full_name", "unknown/unknown")
+        repo_full_name = self._repo(payload).get("full_name", "unknown/unknown")
 
         key = f"issue_comment:{issue_number}:{commenter}:{comment_url}"
         comment_data = {
@@ -352,91 +421,41 @@ class GitHubHandlers:
             "body": body,
             "repo_full_name": repo_full_name
         }
-        self.data_persistence.update_data_store(key, comment_data)
-        asyncio.run_coroutine_threadsafe(
-            self.discord_bot.send_or_edit(key, handler_name="issue_comment"),
-            self.discord_bot.bot.loop
-        )
+        self._publish(key, comment_data, "issue_comment")
 
-    def handle_create(self, payload):
+    def _handle_ref_change(self, payload, kind):
         """
-        Handles the 'create' event from GitHub (e.g., branch or tag creation).
+        Handles the 'create' and 'delete' events from GitHub (e.g., branch or tag creation or deletion).
 
         Parameters:
-        - payload (dict): The webhook payload containing create event information.
+        - payload (dict): The webhook payload containing create or delete event information.
+        - kind (str): The event type, either "create" or "delete".
         """
-        ref_type = payload.get("ref_type", "unknown")  # Type of reference created (branch or tag)
+        ref_type = payload.get("ref_type", "unknown")  # Type of reference (branch or tag)
         ref = payload.get("ref", "unknown")           # Name of the branch or tag
 
         # Attempt to extract 'sender', fallback to 'user' if 'sender' is missing
-        sender_info = payload.get("sender", {})
+        sender_info = payload.get("sender") or _EMPTY
         sender = sender_info.get("login") if sender_info else payload.get("user", "unknown")
 
-        repo_full_name = payload.get("repository", {}).get("full_name", "unknown/unknown")
+        repo_full_name = self._repo(payload).get("full_name", "unknown/unknown")
 
-        if ref_type == "branch":
-            ref_url = f"https://github.com/{repo_full_name}/tree/{ref}"
-        elif ref_type == "tag":
-            ref_url = f"https://github.com/{repo_full_name}/releases/tag/{ref}"
-        else:
-            ref_url = None  # Use None instead of "#"
+        # Only branches and tags have a page to link to
+        ref_url_template = _REF_URL_TEMPLATES.get(ref_type)
+        ref_url = ref_url_template % (repo_full_name, ref) if ref_url_template else ""
 
-        key = f"create:{ref}"  # Unique key based on the reference name
-        create_data = {
+        key = f"{kind}:{ref}"  # Unique key based on the reference name
+        ref_data = {
             "ref_type": ref_type,
             "ref": ref,
             "user": sender,
-            "ref_url": ref_url if ref_url else "",
+            "ref_url": ref_url,
             "repo_full_name": repo_full_name
         }
-        self.data_persistence.update_data_store(key, create_data)
 
-        logging.info(f"Handling create event: {ref_type} '{ref}' by {sender} in {repo_full_name}")
-
-        asyncio.run_coroutine_threadsafe(
-            self.discord_bot.send_or_edit(key, handler_name="create"),
-            self.discord_bot.bot.loop
-        )
-
-    def handle_delete(self, payload):
-        """
-        Handles the 'delete' event from GitHub (e.g., branch or tag deletion).
+        logger.info("Handling %s event: %s '%s' by %s in %s", kind, ref_type, ref, sender, repo_full_name)
 
-        Parameters:
-        - payload (dict): The webhook payload containing delete event information.
-        """
-        ref_type = payload.get("ref_type", "unknown")  # Type of reference deleted (branch or tag)
-        ref = payload.get("ref", "unknown")           # Name of the branch or tag
-
-        # Attempt to extract 'sender', fallback to 'user' if 'sender' is missing
-        sender_info = payload.get("sender", {})
-        sender = sender_info.get("login") if sender_info else payload.get("user", "unknown")
-
-        repo_full_name = payload.get("repository", {}).get("full_name", "unknown/unknown")
-
-        if ref_type == "branch":
-            ref_url = f"https://github.com/{repo_full_name}/tree/{ref}"
-        elif ref_type == "tag":
-            ref_url = f"https://github.com/{repo_full_name}/releases/tag/{ref}"
-        else:
-            ref_url = None  # Use None instead of "#"
-
-        key = f"delete:{ref}"  # Unique key based on the reference name
-        delete_data = {
-            "ref_type": ref_type,
-            "ref": ref,
-            "user": sender,
-            "ref_url": ref_url if ref_url else "",
-            "repo_full_name": repo_full_name
-        }
-        self.data_persistence.update_data_store(key, delete_data)
-
-        logging.info(f"Handling delete event: {ref_type} '{ref}' by {sender} in {repo_full_name}")
-
-        asyncio.run_coroutine_threadsafe(
-            self.discord_bot.send_or_edit(key, handler_name="delete"),
-            self.discord_bot.bot.loop
-        )
+        self._publish(key, ref_data, kind)
 
     def handle_fork(self, payload):
         """
@@ -445,10 +464,10 @@ class GitHubHandlers:
         Parameters:
         - payload (dict): The webhook payload containing fork event information.
         """
-        sender = payload.get("sender", {}).get("login", "unknown")  # User who forked the repository
-        repository = payload.get("repository", {})
+        sender = self._sender(payload)  # User who forked the repository
+        repository = self._repo(payload)
         repo_full_name = repository.get("full_name", "unknown/unknown")  # Original repository name
-        forkee = payload.get("forkee", {})
+        forkee = payload.get("forkee") or _EMPTY
         forkee_name = forkee.get("full_name", "unknown")  # Forked repository name
         forkee_url = forkee.get("html_url", "#")  # URL to the forked repository
 
@@ -460,14 +479,10 @@ class GitHubHandlers:
             "forkee_url": forkee_url,
             "repo_full_name": repo_full_name
         }
-        self.data_persistence.update_data_store(key, fork_data)
 
-        logging.info(f"Handling fork event: {sender} forked {repo_full_name} to {forkee_name}")
+        logger.info("Handling fork event: %s forked %s to %s", sender, repo_full_name, forkee_name)
 
-        asyncio.run_coroutine_threadsafe(
-            self.discord_bot.send_or_edit(key, handler_name="fork"),
-            self.discord_bot.bot.loop
-        )
+        self._publish(key, fork_data, "fork")
 
     def handle_release(self, payload):
         """
@@ -476,12 +491,12 @@ class GitHubHandlers:
         Parameters:
         - payload (dict): The webhook payload containing release event information.
         """
-        release = payload.get("release", {})
+        release = payload.get("release") or _EMPTY
         action = payload.get("action", "unknown")  # Action on the release (e.g., "published", "deleted")
         name = release.get("name", "No Name")  # Name of the release
         url = release.get("html_url", "#")  # URL to the release
-        publisher = payload.get("sender", {}).get("login", "unknown")  # User who published the release
-        repo_full_name = payload.get("repository", {}).get("full_name", "unknown/unknown")
+        publisher = self._sender(payload)  # User who published the release
+        repo_full_name = self._repo(payload).get("full_name", "unknown/unknown")
 
         key = f"release:{name}"  # Unique key based on the release name
         release_data = {
@@ -491,14 +506,10 @@ class GitHubHandlers:
             "publisher": publisher,
             "repo_full_name": repo_full_name
         }
-        self.data_persistence.update_data_store(key, release_data)
 
-        logging.info(f"Handling release event: {action} release '{name}' by {publisher} in {repo_full_name}")
+        logger.info("Handling release event: %s release '%s' by %s in %s", action, name, publisher, repo_full_name)
 
-        asyncio.run_coroutine_threadsafe(
-            self.discord_bot.send_or_edit(key, handler_name="release"),
-            self.discord_bot.bot.loop
-        )
+        self._publish(key, release_data, "release")
 
     def handle_repository(self, payload):
         """
@@ -507,11 +518,11 @@ class GitHubHandlers:
         Parameters:
         - payload (dict): The webhook payload containing repository event information.
         """
-        repo = payload.get("repository", {})
+        repo = self._repo(payload)
         action = payload.get("action", "unknown")  # Action on the repository (e.g., "created", "deleted")
         repo_name = repo.get("full_name", "unknown/unknown")  # Repository full name
         repo_url = repo.get("html_url", "#")  # URL to the repository
-        owner = repo.get("owner", {}).get("login", "unknown")  # Owner of the repository
+        owner = (repo.get("owner") or _EMPTY).get("login", "unknown")  # Owner of the repository
 
         key = f"repository:{repo_name}"  # Unique key based on the repository name
         repository_data = {
@@ -521,14 +532,10 @@ class GitHubHandlers:
             "owner": owner,
             "repo_full_name": repo_name
         }
-        self.data_persistence.update_data_store(key, repository_data)
 
-        logging.info(f"Handling repository event: {action} repository '{repo_name}' by {owner}")
+        logger.info("Handling repository event: %s repository '%s' by %s", action, repo_name, owner)
 
-        asyncio.run_coroutine_threadsafe(
-            self.discord_bot.send_or_edit(key, handler_name="repository"),
-            self.discord_bot.bot.loop
-        )
+        self._publish(key, repository_data, "repository")
 
     def handle_watch(self, payload):
         """
@@ -538,8 +545,8 @@ class GitHubHandlers:
         - payload (dict): The webhook payload containing watch event information.
         """
         action = payload.get("action", "starred")  # Action performed (e.g., "starred", "unstarred")
-        sender = payload.get("sender", {}).get("login", "unknown")  # User who performed the action
-        repository = payload.get("repository", {})
+        sender = self._sender(payload)  # User who performed the action
+        repository = self._repo(payload)
         repo_full_name = repository.get("full_name", "unknown/unknown")  # Repository name
         repo_url = repository.get("html_url", "#")  # URL to the repository
 
@@ -551,14 +558,10 @@ class GitHubHandlers:
             "repo_url": repo_url,
             "repo_full_name": repo_full_name
         }
-        self.data_persistence.update_data_store(key, watch_data)
 
-        logging.info(f"Handling watch event: {sender} {action} repository '{repo_full_name}'")
+        logger.info("Handling watch event: %s %s repository '%s'", sender, action, repo_full_name)
 
-        asyncio.run_coroutine_threadsafe(
-            self.discord_bot.send_or_edit(key, handler_name="watch"),
-            self.discord_bot.bot.loop
-        )
+        self._publish(key, watch_data, "watch")
 
     def handle_member(self, payload):
         """
@@ -567,11 +570,12 @@ class GitHubHandlers:
         Parameters:
         - payload (dict): The webhook payload containing member event information.
         """
-        member = payload.get("member", {})
+        member = payload.get("member") or _EMPTY
         member_login = member.get("login", "unknown")
         action = payload.get("action", "unknown")  # e.g., "added", "removed"
-        repo_full_name = payload.get("repository", {}).get("full_name", "unknown/unknown")
-        repo_url = payload.get("repository", {}).get("html_url", "#")  # Repository URL
+        repository = self._repo(payload)
+        repo_full_name = repository.get("full_name", "unknown/unknown")
+        repo_url = repository.get("html_url", "#")  # Repository URL
 
         key = f"member:{member_login}:{repo_full_name}:{action}"  # Unique key based on member and action
         member_data = {
@@ -580,14 +584,10 @@ class GitHubHandlers:
             "repo_full_name": repo_full_name,
             "repo_url": repo_url
         }
-        self.data_persistence.update_data_store(key, member_data)
 
-        logging.info(f"Handling member event: {action} '{member_login}' in {repo_full_name}")
+        logger.info("Handling member event: %s '%s' in %s", action, member_login, repo_full_name)
 
-        asyncio.run_coroutine_threadsafe(
-            self.discord_bot.send_or_edit(key, handler_name="member"),
-            self.discord_bot.bot.loop
-        )
+        self._publish(key, member_data, "member")
 
     def handle_commit_comment(self, payload):
         """
@@ -596,12 +596,12 @@ class GitHubHandlers:
         Parameters:
         - payload (dict): The webhook payload containing commit comment information.
         """
-        comment = payload.get("comment", {})
+        comment = payload.get("comment") or _EMPTY
         commit_sha = comment.get("commit_id", "unknown")
-        commenter = comment.get("user", {}).get("login", "unknown")
+        commenter = (comment.get("user") or _EMPTY).get("login", "unknown")
         comment_url = comment.get("html_url", "#")
         body = comment.get("body", "")
-        repo_full_name = payload.get("repository", {}).get("full_name", "unknown/unknown")
+        repo_full_name = self._repo(payload).get("full_name", "unknown/unknown")
 
         key = f"commit_comment:{commit_sha}:{commenter}:{comment_url}"  # Unique key based on commit and commenter
         commit_comment_data = {
@@ -611,14 +611,10 @@ class GitHubHandlers:
             "body": body,
             "repo_full_name": repo_full_name
         }
-        self.data_persistence.update_data_store(key, commit_comment_data)
 
-        logging.info(f"Handling commit_comment event: {commenter} commented on commit '{commit_sha}' in {repo_full_name}")
+        logger.info("Handling commit_comment event: %s commented on commit '%s' in %s", commenter, commit_sha, repo_full_name)
 
-        asyncio.run_coroutine_threadsafe(
-            self.discord_bot.send_or_edit(key, handler_name="commit_comment"),
-            self.discord_bot.bot.loop
-        )
+        self._publish(key, commit_comment_data, "commit_comment")
 
     def handle_public(self, payload):
         """
@@ -628,10 +624,10 @@ class GitHubHandlers:
         - payload (dict): The webhook payload containing public event information.
         """
         action = payload.get("action", "made public")  # Action performed (e.g., "made public")
-        repository = payload.get("repository", {})
+        repository = self._repo(payload)
         repo_full_name = repository.get("full_name", "unknown/unknown")
         repo_url = repository.get("html_url", "#")
-        sender = payload.get("sender", {}).get("login", "unknown")  # User who performed the action
+        sender = self._sender(payload)  # User who performed the action
 
         key = f"public:{repo_full_name}"  # Unique key based on repository name
         public_data = {
@@ -640,11 +636,7 @@ class GitHubHandlers:
             "repo_url": repo_url,
             "sender": sender
         }
-        self.data_persistence.update_data_store(key, public_data)
 
-        logging.info(f"Handling public event: Repository '{repo_full_name}' {action} by {sender}")
+        logger.info("Handling public event: Repository '%s' %s by %s", repo_full_name, action, sender)
 
-        asyncio.run_coroutine_threadsafe(
-            self.discord_bot.send_or_edit(key, handler_name="public"),
-            self.discord_bot.bot.loop
-        )
+        self._publish(key, public_data, "public")
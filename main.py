@@ -1,31 +1,55 @@
 # main.py
 
+import asyncio
 import logging
+import signal
 import threading
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    from waitress import serve
+except ImportError:
+    serve = None
+
 from config import Config
 from bot.discord_bot import DiscordBot
 from flask_app.webhook import create_flask_app
 from persistence.data_persistence import DataPersistence
+from persistence.sqlite_persistence import SQLitePersistence, SQLITE_EXTENSIONS
 from handlers.github_handlers import GitHubHandlers
 
 def run_flask(app):
     """
-    Runs the Flask application.
+    Runs the Flask application, served by waitress's worker thread pool when it is installed.
 
     Parameters:
     - app: The Flask application instance.
     """
-    app.run(host="0.0.0.0", port=25578, debug=False)
+    if serve is not None:
+        serve(app, host="0.0.0.0", port=25578, threads=16)
+    else:
+        app.run(host="0.0.0.0", port=25578, debug=False)
 
 def main():
     """
     The main function that initializes data persistence, Discord bot, and Flask server.
     It runs the Flask server in a separate daemon thread to allow the Discord bot to operate concurrently.
     """
-    # Initialize data persistence
-    data_persistence = DataPersistence(Config.DATA_STORE_FILE)
-    data_persistence.load_data()
+    # Use uvloop for the Discord bot's event loop when available; it also makes the
+    # cross-thread wakeups from the webhook handlers cheaper
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logging.info("Using uvloop event loop.")
+
+    # Initialize data persistence; the data is loaded once the web server is starting
+    if Config.DATA_STORE_FILE.endswith(SQLITE_EXTENSIONS):
+        data_persistence = SQLitePersistence(Config.DATA_STORE_FILE)
+    else:
+        data_persistence = DataPersistence(Config.DATA_STORE_FILE)
 
     # Initialize Discord Bot
     discord_bot = DiscordBot(Config, data_persistence)
@@ -33,16 +57,28 @@ def main():
     # Initialize GitHub Handlers with the Discord Bot instance
     github_handlers = GitHubHandlers(data_persistence, discord_bot)
 
-    # Create Flask App
-    flask_app = create_flask_app(Config, data_persistence, github_handlers)
+    # Create Flask App; it answers 503 until the data is loaded and the bot's event loop runs
+    ready_event = threading.Event()
+    discord_bot.add_startup_callback(ready_event.set)
+    flask_app = create_flask_app(Config, data_persistence, github_handlers, ready_event=ready_event)
 
-    # Start Flask server in a separate daemon thread
+    # Start Flask server in a separate daemon thread so it binds its port while the data loads
     flask_thread = threading.Thread(target=run_flask, args=(flask_app,), daemon=True)
     flask_thread.start()
     logging.info("Flask server started in a separate thread.")
 
-    # Run Discord Bot (blocking call)
-    discord_bot.run()
+    data_persistence.load_data()
+
+    # Treat SIGTERM (e.g., docker stop) like Ctrl+C, so the bot closes cleanly and
+    # pending writes are flushed below instead of the process being killed outright
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    try:
+        # Run Discord Bot (blocking call)
+        discord_bot.run()
+    finally:
+        data_persistence.shutdown()
+        logging.info("Data persistence shut down.")
 
 if __name__ == "__main__":
     # Configure logging to include timestamp and log level
@@ -0,0 +1,3 @@
+# persistence/__init__.py
+
+# This file is intentionally left blank to make 'persistence' a Python package.
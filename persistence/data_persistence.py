@@ -1,101 +1,601 @@
 # persistence/data_persistence.py
 
+import atexit
 import json
+import mmap
+import os
+import queue
 import threading
+import time
 import logging
+from types import MappingProxyType
+from typing import Any, BinaryIO, Callable, Dict, List, Mapping, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgpack  # type: ignore[import-untyped]
+except ImportError:
+    msgpack = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Files are parsed with orjson when it is installed
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Shared stdlib encoders for when orjson is not installed; JSONEncoder keeps no
+# per-call state, so one instance of each can serve every thread
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+_JSON_PRETTY_ENCODER = json.JSONEncoder(indent=2)
+
+def _dumps(obj: Any, pretty: bool = False, newline: bool = False) -> bytes:
+    """
+    Serializes an object to JSON bytes, using orjson when it is installed.
+
+    Parameters:
+    - obj: The object to serialize.
+    - pretty (bool): Whether to indent the output by two spaces.
+    - newline (bool): Whether to terminate the output with a newline.
+
+    Returns:
+    - bytes: The UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if newline:
+            # Appended by orjson in its output buffer, avoiding a bytes concatenation
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, option=option)
+    text = (_JSON_PRETTY_ENCODER if pretty else _JSON_ENCODER).encode(obj)
+    return (text + "\n" if newline else text).encode()
+
+# Data files with this extension store their snapshot as MessagePack instead of JSON
+MSGPACK_EXTENSION = ".mpk"
+
+# Write-ahead log operations and the snapshot key of the dictionary each one updates
+_WAL_TARGETS = {"data": "DATA_STORE", "message": "MESSAGE_MAP"}
 
 class DataPersistence:
     """
-    Handles loading and saving of persistent data to a JSON file.
+    Handles loading and saving of persistent data to a JSON file, or a MessagePack
+    file if the path ends in ".mpk".
+    Updates are appended to a write-ahead log next to the file and folded into
+    a full snapshot of the file periodically.
     Ensures thread-safe operations using a threading lock.
     """
-    def __init__(self, file_path):
+    # Number of logged updates after which the full snapshot is rewritten
+    SNAPSHOT_INTERVAL = 500
+    # Seconds the flusher waits after a snapshot is requested, coalescing bursts of updates
+    FLUSH_DELAY = 0.5
+    # Seconds shutdown waits for each background thread to finish
+    SHUTDOWN_TIMEOUT = 5
+    # Maximum number of queued update records appended to the log in one write
+    WAL_BATCH_SIZE = 256
+    # Seconds logged records may stay unsynced, bounding what a power loss can lose
+    WAL_FSYNC_INTERVAL = 1.0
+
+    def __init__(self, file_path: str) -> None:
         """
         Initializes the DataPersistence instance.
 
         Parameters:
-        - file_path (str): Path to the JSON file for data storage.
+        - file_path (str): Path to the JSON (or ".mpk" MessagePack) file for data storage.
+
+        Raises:
+        - ImportError: If a MessagePack file is requested but msgpack is not installed.
         """
-        self.file_path = file_path
-        self.DATA_STORE = {}
-        self.MESSAGE_MAP = {}
-        self.data_lock = threading.Lock()
+        self.file_path: str = file_path
+        self.use_msgpack: bool = file_path.endswith(MSGPACK_EXTENSION)
+        if self.use_msgpack and msgpack is None:
+            raise ImportError(f"msgpack is required to store data in {file_path}")
+        self.wal_path: str = file_path + ".wal"
+        self.DATA_STORE: Dict[str, Any] = {}
+        self.MESSAGE_MAP: Dict[str, int] = {}
+        self.data_lock = threading.RLock()
+        self._change_listeners: List[Callable[[Mapping[str, Any]], None]] = []
+        self._wal: Optional[BinaryIO] = None
+        self._wal_entries: int = 0
+        # Sequence number of the latest update, and of the latest one a snapshot includes
+        self._update_seq: int = 0
+        self._saved_seq: int = 0
+        # Updates made since the last save, whether or not they reached the log
+        self._unsaved: int = 0
+        self._closed: bool = False
+        self._wal_synced: float = time.monotonic()
+        self._wal_unsynced: bool = False
+        self._wal_queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._wal_writer = threading.Thread(target=self._wal_writer_loop, name="data-persistence-wal-writer", daemon=True)
+        self._wal_writer.start()
+        self._dirty = threading.Event()
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name="data-persistence-flusher", daemon=True)
+        self._flusher.start()
+        atexit.register(self.shutdown)
 
-    def load_data(self):
+    def load_data(self) -> None:
         """
-        Loads DATA_STORE and MESSAGE_MAP from the JSON file.
-        If the file doesn't exist, initializes empty structures.
+        Loads DATA_STORE and MESSAGE_MAP from the data file and replays the updates
+        logged since it was last saved.
+        If the file doesn't exist, migrates a JSON file of the same name when switching
+        formats, or initializes empty structures otherwise.
         """
+        with self.data_lock:
+            needs_snapshot = False
+            data: Optional[Dict[str, Any]]
+            try:
+                data = self._read_snapshot()
+                logger.info("Data loaded from %s", self.file_path)
+            except FileNotFoundError:
+                data = self._load_json_for_migration()
+                if data is None:
+                    # The file is created by the first snapshot
+                    logger.info("No existing %s found. Starting with empty data stores.", self.file_path)
+                    data = {}
+                else:
+                    needs_snapshot = True
+            except ValueError as e:
+                # Keep the unreadable file for manual recovery instead of overwriting it
+                corrupt_path = f"{self.file_path}.corrupt.{time.strftime('%Y%m%d-%H%M%S')}"
+                os.replace(self.file_path, corrupt_path)
+                logger.error("Error decoding %s: %s. Moved it to %s.", self.file_path, e, corrupt_path)
+                data = {}
+            self.DATA_STORE = data.get("DATA_STORE", {})
+            self.MESSAGE_MAP = data.get("MESSAGE_MAP", {})
+            if self._replay_wal() or needs_snapshot:
+                # Fold the replayed updates into the snapshot and start a fresh log, so new
+                # records are never appended to an incomplete one
+                self._save_locked()
+        self._notify_change_listeners()
+
+    def _load_json_for_migration(self) -> Optional[Dict[str, Any]]:
+        """
+        Reads the JSON data file that a data file in another format replaces
+        (e.g., data_store.json for data_store.mpk), with the updates from its
+        write-ahead log applied.
+
+        Returns:
+        - dict or None: The JSON file's contents, or None if there is nothing to migrate.
+        """
+        json_path = os.path.splitext(self.file_path)[0] + ".json"
+        if json_path == self.file_path:
+            return None
         try:
-            with open(self.file_path, "r") as f:
-                data = json.load(f)
-                self.DATA_STORE = data.get("DATA_STORE", {})
-                self.MESSAGE_MAP = data.get("MESSAGE_MAP", {})
-            logging.info(f"Data loaded from {self.file_path}")
+            with open(json_path, "rb") as f:
+                data = _loads(f.read())
         except FileNotFoundError:
-            logging.info(f"No existing {self.file_path} found. Starting with empty data stores.")
-            self.DATA_STORE = {}
-            self.MESSAGE_MAP = {}
-            self.save_data()
-        except json.JSONDecodeError as e:
-            logging.error(f"Error decoding JSON from {self.file_path}: {e}")
-            self.DATA_STORE = {}
-            self.MESSAGE_MAP = {}
-            self.save_data()
-
-    def save_data(self):
-        """
-        Saves DATA_STORE and MESSAGE_MAP to the JSON file.
-        Ensures thread-safe write operations.
+            data = None
+        except ValueError as e:
+            logger.error("Error decoding JSON from %s, not migrating it: %s", json_path, e)
+            return None
+        if data is not None and not isinstance(data, dict):
+            logger.error("%s does not hold a mapping, not migrating it", json_path)
+            return None
+        # Updates logged since the JSON file's last snapshot are only in its log
+        migrated: Dict[str, Any] = data if data is not None else {}
+        if not self._apply_wal(json_path + ".wal", migrated) and data is None:
+            return None
+        logger.info("Migrating data from %s to %s", json_path, self.file_path)
+        return migrated
+
+    def _encode_snapshot(self, data: Dict[str, Any]) -> bytes:
+        """
+        Serializes a snapshot in the data file's format.
+
+        Parameters:
+        - data (dict): The snapshot to serialize.
+
+        Returns:
+        - bytes: The encoded snapshot.
+        """
+        if self.use_msgpack:
+            return msgpack.packb(data, use_bin_type=True)
+        return _dumps(data)
+
+    def _read_snapshot(self) -> Dict[str, Any]:
+        """
+        Reads and decodes the data file. When the decoder accepts buffers (orjson, msgpack),
+        it parses straight from a read-only memory map instead of copying the file into memory.
+
+        Returns:
+        - dict: The decoded snapshot.
+
+        Raises:
+        - FileNotFoundError: If the data file does not exist.
+        - ValueError: If the contents cannot be decoded.
+        """
+        with open(self.file_path, "rb") as f:
+            # mmap cannot map an empty file, and json.loads only accepts bytes
+            if os.fstat(f.fileno()).st_size == 0 or (orjson is None and not self.use_msgpack):
+                return self._decode_snapshot(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    return self._decode_snapshot(view)
+                finally:
+                    view.release()
+
+    def _decode_snapshot(self, raw: Any) -> Dict[str, Any]:
+        """
+        Deserializes a snapshot read from the data file.
+
+        Parameters:
+        - raw (bytes-like): The file contents.
+
+        Returns:
+        - dict: The decoded snapshot.
+
+        Raises:
+        - ValueError: If the contents cannot be decoded.
+        """
+        if self.use_msgpack:
+            data = msgpack.unpackb(raw, raw=False)
+        else:
+            data = _loads(raw)
+        if not isinstance(data, dict):
+            raise ValueError("snapshot is not a mapping")
+        return data
+
+    def _replay_wal(self) -> bool:
+        """
+        Applies the updates recorded in the write-ahead log to the in-memory stores.
+        Must be called with data_lock held.
+
+        Returns:
+        - bool: True if the log holds any records, readable or not, and needs to be
+          folded into a snapshot and truncated.
+        """
+        return self._apply_wal(self.wal_path, {
+            "DATA_STORE": self.DATA_STORE,
+            "MESSAGE_MAP": self.MESSAGE_MAP
+        })
+
+    def _apply_wal(self, wal_path: str, data: Dict[str, Any]) -> bool:
+        """
+        Applies the updates recorded in a write-ahead log to a snapshot.
+
+        Parameters:
+        - wal_path (str): Path to the write-ahead log.
+        - data (dict): The snapshot to update in place; missing dictionaries are created.
+
+        Returns:
+        - bool: True if the log holds any records, readable or not.
+        """
+        replayed = 0
+        skipped = 0
+        try:
+            with open(wal_path, "rb") as f:
+                for line in f:
+                    try:
+                        record = _loads(line)
+                        data.setdefault(_WAL_TARGETS[record["op"]], {})[record["k"]] = record["v"]
+                    except (ValueError, KeyError, TypeError):
+                        # A crash mid-append can leave the last record incomplete
+                        skipped += 1
+                        continue
+                    replayed += 1
+        except FileNotFoundError:
+            return False
+        if skipped:
+            logger.warning("Skipped %d unreadable records in %s", skipped, wal_path)
+        if replayed:
+            logger.info("Replayed %d updates from %s", replayed, wal_path)
+        return bool(replayed or skipped)
+
+    def _append_wal(self, records: bytes, count: int) -> bool:
+        """
+        Appends encoded updates to the write-ahead log. Must be called with data_lock held.
+
+        Parameters:
+        - records (bytes): One or more newline-terminated JSON records.
+        - count (int): The number of records.
+
+        Returns:
+        - bool: True if enough updates were logged that a snapshot is due.
+        """
+        if self._wal is None:
+            self._wal = open(self.wal_path, "ab", buffering=0)
+        # An unbuffered write may be short, so write until every byte is in the log
+        view = memoryview(records)
+        while view:
+            view = view[self._wal.write(view):]
+        self._wal_unsynced = True
+        self._wal_entries += count
+        return self._wal_entries >= self.SNAPSHOT_INTERVAL
+
+    def _wal_writer_loop(self) -> None:
+        """
+        Background thread that appends queued update records to the write-ahead log,
+        writing up to WAL_BATCH_SIZE records per call, and syncs the log to disk within
+        WAL_FSYNC_INTERVAL seconds of a write. A None record stops the thread.
+        """
+        while True:
+            try:
+                batch = [self._wal_queue.get(timeout=self.WAL_FSYNC_INTERVAL)]
+            except queue.Empty:
+                # Idle, so the last records written are not followed by a write that syncs them
+                self._sync_wal()
+                continue
+            while len(batch) < self.WAL_BATCH_SIZE:
+                try:
+                    batch.append(self._wal_queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = None in batch
+            if stopping:
+                batch = batch[:batch.index(None)]
+            if batch:
+                self._write_batch(batch)
+            if stopping:
+                return
+            if time.monotonic() - self._wal_synced >= self.WAL_FSYNC_INTERVAL:
+                self._sync_wal()
+
+    def _sync_wal(self) -> None:
+        """
+        Flushes the records written to the write-ahead log since the last call to disk.
+        Called on the writer thread; the fsync runs outside data_lock, as it can stall.
         """
         with self.data_lock:
-            with open(self.file_path, "w") as f:
-                json.dump({
-                    "DATA_STORE": self.DATA_STORE,
-                    "MESSAGE_MAP": self.MESSAGE_MAP
-                }, f, indent=2)
-        logging.info(f"Data saved to {self.file_path}")
+            wal = self._wal if self._wal_unsynced else None
+            self._wal_unsynced = False
+        self._wal_synced = time.monotonic()
+        if wal is None:
+            return
+        try:
+            os.fsync(wal.fileno())
+        except OSError as e:
+            logger.error("Error syncing %s: %s", self.wal_path, e)
 
-    def get_data_store(self):
+    def _write_batch(self, batch: List[Any]) -> None:
         """
-        Retrieves the DATA_STORE dictionary in a thread-safe manner.
+        Persists a batch of queued updates by appending them to the write-ahead log.
+        Called on the writer thread.
+
+        Parameters:
+        - batch (list): (sequence number, update as encoded by _encode_update) pairs,
+          in the order the updates were made.
+        """
+        try:
+            with self.data_lock:
+                records = self._unsaved_records(batch)
+                if not records:
+                    return
+                snapshot_due = self._append_wal(b"".join(records), len(records))
+            if snapshot_due:
+                self._dirty.set()
+        except OSError as e:
+            logger.error("Error writing %s: %s", self.wal_path, e)
+            # The batch is only in memory now, and the log may end in a partial record;
+            # a snapshot saves the updates and truncates the log
+            self._dirty.set()
+
+    def _unsaved_records(self, batch: List[Any]) -> List[Any]:
+        """
+        Drops the queued updates that a snapshot taken after they were queued already
+        includes. Writing them after that snapshot truncated the log would let a crash
+        replay them over the newer values. Must be called with data_lock held.
+
+        Parameters:
+        - batch (list): (sequence number, encoded update) pairs taken from the queue.
 
         Returns:
-        - dict: The DATA_STORE.
+        - list: The encoded updates that are not part of the snapshot yet.
+        """
+        return [record for seq, record in batch if seq > self._saved_seq]
+
+    def _flush_loop(self) -> None:
+        """
+        Background thread that writes a snapshot whenever one is requested, at most
+        once per FLUSH_DELAY seconds.
+        """
+        while True:
+            self._dirty.wait()
+            if self._stop.is_set():
+                return
+            time.sleep(self.FLUSH_DELAY)
+            self._dirty.clear()
+            try:
+                self.save_data()
+            except OSError as e:
+                logger.error("Error saving %s: %s", self.file_path, e)
+
+    def shutdown(self) -> None:
+        """
+        Stops the background threads, writing out queued log records, and folds every
+        unsaved update into a final snapshot, including any the writer did not log.
+        Later updates are rejected. Safe to call more than once.
+        Called by main on shutdown and registered with atexit as a fallback.
+        """
+        if self._stop.is_set():
+            return
+        self._wal_queue.put_nowait(None)
+        self._wal_writer.join(self.SHUTDOWN_TIMEOUT)
+        self._stop.set()
+        self._dirty.set()
+        self._flusher.join(self.SHUTDOWN_TIMEOUT)
+        with self.data_lock:
+            if self._unsaved:
+                self._save_locked()
+            self._closed = True
+
+    def add_change_listener(self, callback: Callable[[Mapping[str, Any]], None]) -> None:
+        """
+        Registers a callback that is invoked whenever the DATA_STORE dictionary is replaced
+        (e.g., by load_data). Updates mutate the DATA_STORE in place and do not trigger it.
+
+        Parameters:
+        - callback (Callable[[Mapping], None]): Called with a read-only view of the new DATA_STORE.
+        """
+        self._change_listeners.append(callback)
+
+    def _notify_change_listeners(self) -> None:
+        """
+        Invokes every registered change listener with the current DATA_STORE.
+        """
+        data_store = self.get_data_store()
+        for callback in self._change_listeners:
+            callback(data_store)
+
+    def save_data(self) -> None:
+        """
+        Saves a full snapshot of DATA_STORE and MESSAGE_MAP to the JSON file and
+        truncates the write-ahead log it supersedes.
+        Ensures thread-safe write operations.
         """
         with self.data_lock:
-            return self.DATA_STORE
+            self._save_locked()
+
+    def _save_locked(self) -> None:
+        """
+        Writes the snapshot and truncates the write-ahead log. Must be called with data_lock held.
+        """
+        # Write to a temporary file and swap it in, so a crash mid-write never
+        # leaves a truncated snapshot behind
+        tmp_path = self.file_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self._encode_snapshot({
+                "DATA_STORE": self.DATA_STORE,
+                "MESSAGE_MAP": self.MESSAGE_MAP
+            }))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.file_path)
+        self._fsync_directory()
+        if self._wal is not None:
+            self._wal.truncate(0)
+        elif os.path.exists(self.wal_path):
+            os.truncate(self.wal_path, 0)
+        self._wal_entries = 0
+        self._saved_seq = self._update_seq
+        self._unsaved = 0
+        logger.info("Data saved to %s", self.file_path)
 
-    def get_message_map(self):
+    def dump_pretty(self) -> str:
         """
-        Retrieves the MESSAGE_MAP dictionary in a thread-safe manner.
+        Renders DATA_STORE and MESSAGE_MAP as indented JSON for debugging.
+        The data file itself is written compactly.
 
         Returns:
-        - dict: The MESSAGE_MAP.
+        - str: The indented JSON document.
         """
         with self.data_lock:
-            return self.MESSAGE_MAP
+            return _dumps({
+                "DATA_STORE": self.DATA_STORE,
+                "MESSAGE_MAP": self.MESSAGE_MAP
+            }, pretty=True).decode()
+
+    def _fsync_directory(self) -> None:
+        """
+        Flushes the directory entry of the data file so a completed rename survives a power loss.
+        Skipped on platforms that cannot open directories (e.g., Windows).
+        """
+        if os.name != "posix":
+            return
+        fd = os.open(os.path.dirname(os.path.abspath(self.file_path)), os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
-    def update_data_store(self, key, value):
+    def get_data_store(self) -> Mapping[str, Any]:
+        """
+        Retrieves a read-only view of the DATA_STORE dictionary.
+        The view reflects later updates; use update_data_store to change entries.
+
+        Returns:
+        - MappingProxyType: The DATA_STORE view.
+        """
+        return MappingProxyType(self.DATA_STORE)
+
+    def get_entry(self, key: str, default: Any = None) -> Any:
+        """
+        Retrieves a single DATA_STORE entry.
+
+        Parameters:
+        - key (str): The unique key for the data entry.
+        - default: Value returned when the key is not stored.
+
+        Returns:
+        - The stored value, or default if the key is not present.
+        """
+        return self.DATA_STORE.get(key, default)
+
+    def get_message_map(self) -> Mapping[str, int]:
+        """
+        Retrieves a read-only view of the MESSAGE_MAP dictionary.
+        The view reflects later updates; use update_message_map to change entries.
+
+        Returns:
+        - MappingProxyType: The MESSAGE_MAP view.
+        """
+        return MappingProxyType(self.MESSAGE_MAP)
+
+    def update_data_store(self, key: str, value: Any) -> None:
         """
         Updates the DATA_STORE with the given key and value.
 
         Parameters:
         - key (str): The unique key for the data entry.
         - value (dict): The data to store.
+
+        Raises:
+        - RuntimeError: If the persistence layer has been shut down.
         """
-        with self.data_lock:
-            self.DATA_STORE[key] = value
-        self.save_data()
+        self._apply_update("data", key, value)
 
-    def update_message_map(self, key, message_id):
+    def update_message_map(self, key: str, message_id: int) -> None:
         """
         Updates the MESSAGE_MAP with the given key and Discord message ID.
 
         Parameters:
         - key (str): The unique key corresponding to the data entry.
         - message_id (int): The Discord message ID.
+
+        Raises:
+        - RuntimeError: If the persistence layer has been shut down.
         """
+        self._apply_update("message", key, message_id)
+
+    def _apply_update(self, op: str, key: str, value: Any) -> None:
+        """
+        Stores a value in the dictionary for the operation and queues it for the write-ahead log.
+        Readers see the new value immediately; the log write happens on the writer thread.
+
+        Parameters:
+        - op (str): The operation, "data" or "message".
+        - key (str): The key to update.
+        - value: The new value.
+
+        Raises:
+        - RuntimeError: If the persistence layer has been shut down.
+        """
+        # Encode before taking the lock; only the store update and the enqueue
+        # must be serialized to keep the log in the same order as the stores
+        record = self._encode_update(op, key, value)
         with self.data_lock:
-            self.MESSAGE_MAP[key] = message_id
-        self.save_data()
+            if self._closed:
+                # The final snapshot is written, so the update could not be saved
+                raise RuntimeError(f"{self.file_path} is shut down, not storing {key}")
+            getattr(self, _WAL_TARGETS[op])[key] = value
+            self._unsaved += 1
+            self._update_seq += 1
+            self._wal_queue.put_nowait((self._update_seq, record))
+
+    def _encode_update(self, op: str, key: str, value: Any) -> Any:
+        """
+        Encodes an update for the writer thread.
+
+        Parameters:
+        - op (str): The operation, "data" or "message".
+        - key (str): The key to update.
+        - value: The new value.
+
+        Returns:
+        - bytes: The newline-terminated write-ahead log record.
+        """
+        return _dumps({"op": op, "k": key, "v": value}, newline=True)
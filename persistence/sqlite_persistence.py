@@ -0,0 +1,205 @@
+# persistence/sqlite_persistence.py
+
+import logging
+import sqlite3
+import threading
+from typing import Any, List, Optional, Tuple
+
+try:
+    import msgpack  # type: ignore[import-untyped]
+except ImportError:
+    msgpack = None  # type: ignore[assignment]
+
+from persistence.data_persistence import DataPersistence, _dumps, _loads
+
+logger = logging.getLogger(__name__)
+
+# Data files with these extensions are stored in SQLite instead of a snapshot file
+SQLITE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+# Encodings of the value column, recorded in the database's user_version
+_JSON_VALUES = 0
+_MSGPACK_VALUES = 1
+
+class SQLitePersistence(DataPersistence):
+    """
+    Stores DATA_STORE and MESSAGE_MAP in an SQLite database in WAL mode, one row per key.
+    The dictionaries stay in memory as the read path; each update writes only its own row,
+    batched into a single transaction by the writer thread.
+    Values are encoded as MessagePack, or as JSON when msgpack is not installed.
+    """
+    def __init__(self, file_path: str) -> None:
+        """
+        Initializes the SQLitePersistence instance and creates the tables if needed.
+
+        Parameters:
+        - file_path (str): Path to the SQLite database file.
+
+        Raises:
+        - ImportError: If the database stores MessagePack values but msgpack is not installed.
+        """
+        # The connection is shared by the loading, writer and shutdown threads
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(file_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS data (k TEXT PRIMARY KEY, v BLOB NOT NULL)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS msgmap (k TEXT PRIMARY KEY, mid INTEGER NOT NULL)")
+        # Databases written before values were stored as MessagePack hold JSON
+        self._stored_format: int = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if self._stored_format == _MSGPACK_VALUES and msgpack is None:
+            self._conn.close()
+            raise ImportError(f"msgpack is required to read {file_path}")
+        # Started only once the database is known to be readable
+        super().__init__(file_path)
+        self.use_msgpack = msgpack is not None
+
+    def load_data(self) -> None:
+        """
+        Loads DATA_STORE and MESSAGE_MAP from the database.
+        If the database is empty, migrates a JSON data file of the same name. Values
+        stored in another encoding than the current one are rewritten.
+        """
+        with self.data_lock:
+            with self._db_lock:
+                data_rows = self._conn.execute("SELECT k, v FROM data").fetchall()
+                message_rows = self._conn.execute("SELECT k, mid FROM msgmap").fetchall()
+            self.DATA_STORE = {key: self._decode_value(value, self._stored_format) for key, value in data_rows}
+            self.MESSAGE_MAP = dict(message_rows)
+            if not data_rows and not message_rows:
+                data = self._load_json_for_migration()
+                if data is not None:
+                    self.DATA_STORE = data.get("DATA_STORE", {})
+                    self.MESSAGE_MAP = data.get("MESSAGE_MAP", {})
+                    self._save_locked()
+                else:
+                    self._write_rows([], [], self._value_format())
+            elif self._stored_format != self._value_format():
+                logger.info("Re-encoding the values in %s", self.file_path)
+                self._save_locked()
+            logger.info("Data loaded from %s", self.file_path)
+        self._notify_change_listeners()
+
+    def _save_locked(self) -> None:
+        """
+        Writes every entry of both dictionaries to the database. Must be called with data_lock held.
+        Regular updates only write their own row; this is used for migrations.
+        """
+        self._write_rows(
+            [(key, self._encode_value(value)) for key, value in self.DATA_STORE.items()],
+            list(self.MESSAGE_MAP.items()),
+            self._value_format()
+        )
+        self._saved_seq = self._update_seq
+        self._unsaved = 0
+        logger.info("Data saved to %s", self.file_path)
+
+    def _encode_update(self, op: str, key: str, value: Any) -> Tuple[str, str, Any]:
+        """
+        Encodes an update for the writer thread.
+
+        Parameters:
+        - op (str): The operation, "data" or "message".
+        - key (str): The key to update.
+        - value: The new value.
+
+        Returns:
+        - tuple: The operation, key and column value for the row.
+        """
+        return (op, key, self._encode_value(value) if op == "data" else value)
+
+    def _value_format(self) -> int:
+        """
+        Looks up the encoding that new values are written in.
+
+        Returns:
+        - int: _MSGPACK_VALUES, or _JSON_VALUES if msgpack is not installed.
+        """
+        return _MSGPACK_VALUES if self.use_msgpack else _JSON_VALUES
+
+    def _encode_value(self, value: Any) -> bytes:
+        """
+        Encodes a DATA_STORE value for the data table.
+
+        Parameters:
+        - value: The value to encode.
+
+        Returns:
+        - bytes: The value as MessagePack, or as JSON if msgpack is not installed.
+        """
+        if self.use_msgpack:
+            return msgpack.packb(value, use_bin_type=True)
+        return _dumps(value)
+
+    @staticmethod
+    def _decode_value(raw: bytes, value_format: int) -> Any:
+        """
+        Decodes a value read from the data table.
+
+        Parameters:
+        - raw (bytes): The stored value.
+        - value_format (int): The encoding the database stores values in.
+
+        Returns:
+        - The decoded value.
+        """
+        if value_format == _MSGPACK_VALUES:
+            return msgpack.unpackb(raw, raw=False)
+        return _loads(raw)
+
+    def _write_batch(self, batch: List[Any]) -> None:
+        """
+        Writes a batch of queued updates to the database in one transaction.
+        Called on the writer thread.
+
+        Parameters:
+        - batch (list): (sequence number, update as encoded by _encode_update) pairs,
+          in the order the updates were made.
+        """
+        try:
+            # Held across the write so a full save cannot slip in between and be
+            # overwritten with the older rows
+            with self.data_lock:
+                records = self._unsaved_records(batch)
+                self._write_rows(
+                    [(key, value) for op, key, value in records if op == "data"],
+                    [(key, value) for op, key, value in records if op == "message"]
+                )
+                # Each row is saved as soon as its transaction commits
+                self._unsaved -= len(records)
+        except sqlite3.Error as e:
+            logger.error("Error writing %s: %s", self.file_path, e)
+            # The batch is only in memory now; a full save writes it out
+            self._dirty.set()
+
+    def _write_rows(
+        self,
+        data_rows: List[Tuple[str, bytes]],
+        message_rows: List[Tuple[str, int]],
+        value_format: Optional[int] = None
+    ) -> None:
+        """
+        Inserts or replaces rows in both tables in a single transaction.
+
+        Parameters:
+        - data_rows (list): (key, encoded value) pairs for the data table.
+        - message_rows (list): (key, message ID) pairs for the msgmap table.
+        - value_format (int, optional): Encoding to record for the data table, when
+          data_rows covers every row. Recorded in the same transaction as the rows.
+        """
+        with self._db_lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany("INSERT OR REPLACE INTO data (k, v) VALUES (?, ?)", data_rows)
+            self._conn.executemany("INSERT OR REPLACE INTO msgmap (k, mid) VALUES (?, ?)", message_rows)
+            if value_format is not None:
+                self._conn.execute(f"PRAGMA user_version = {value_format:d}")
+                self._stored_format = value_format
+
+    def shutdown(self) -> None:
+        """
+        Stops the background threads, writing out queued updates, and closes the database.
+        Safe to call more than once.
+        """
+        super().shutdown()
+        with self._db_lock:
+            self._conn.close()